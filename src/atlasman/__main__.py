@@ -2,11 +2,166 @@
 Atlas-Man CLI - A Command Line Interface to manage Trello and Jira projects.
 """
 
-import argparse
-from typing import Tuple, List
+from __future__ import annotations
+
+import functools
+import os
+import sys
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 from atlasman.config import edit_config, load_config
-from atlasman.trello_commands import TrelloCommands
-from atlasman.jira_commands import JiraCommands
+
+if TYPE_CHECKING:
+    import argparse
+
+# Help text for the top-level parser, printed without importing argparse
+HELP_TEXT = """\
+usage: atlasman [-h] [--version] [--trello] [--jira] [--config]
+
+A CLI to manage Trello and Jira projects
+
+options:
+  -h, --help     show this help message and exit
+  --version      show program's version number and exit
+  --trello, --t  Use Trello commands
+  --jira, --j    Use Jira commands
+  --config       Edit the configuration file
+"""
+
+# Flags and add_argument keyword arguments for each Trello action
+TRELLO_ARGUMENTS: Tuple[Tuple[Tuple[str, ...], Dict[str, Any]], ...] = (
+    (("--boards",), {
+        "action": "store_true",
+        "help": "List all Trello boards",
+    }),
+    (("--lists",), {
+        "metavar": "BOARD_NAME",
+        "nargs": "+",
+        "help": "List all Trello lists for one or more specified boards",
+    }),
+    (("--cards",), {
+        "metavar": "LIST_ID",
+        "type": str,
+        "help": "List all cards for a specified list by list ID",
+    }),
+    (("--tree",), {
+        "metavar": "BOARD_NAME",
+        "type": str,
+        "help": "List all Trello lists of a specified board, each with its cards",
+    }),
+    (("--add-board",), {
+        "metavar": "BOARD_NAME",
+        "type": str,
+        "help": "Create a new Trello board",
+    }),
+    (("--add-list",), {
+        "metavar": ("BOARD_NAME", "LIST_NAME"),
+        "nargs": 2,
+        "help": "Create a new Trello list in a specified board",
+    }),
+    (("--add-card",), {
+        "metavar": ("LIST_NAME", "CARD_NAME"),
+        "nargs": 2,
+        "help": "Create a new Trello card in a specified list",
+    }),
+    (("--update-board",), {
+        "metavar": ("BOARD_ID", "NEW_NAME"),
+        "nargs": 2,
+        "help": "Update a Trello board",
+    }),
+    (("--update-list",), {
+        "metavar": ("LIST_ID", "NEW_NAME"),
+        "nargs": 2,
+        "help": "Update a Trello list",
+    }),
+    (("--update-card",), {
+        "metavar": ("CARD_ID", "NEW_NAME"),
+        "nargs": '+',
+        "help": "Update a Trello card: CARD_ID NEW_NAME [DESCRIPTION]. \
+DESCRIPTION is optional.",
+    }),
+    (("--delete-board",), {
+        "metavar": "BOARD_NAME",
+        "type": str,
+        "help": "Delete a Trello board",
+    }),
+    (("--delete-list",), {
+        "metavar": "LIST_NAME",
+        "type": str,
+        "help": "Delete a Trello list from a specified board",
+    }),
+    (("--delete-card",), {
+        "metavar": "CARD_NAME",
+        "type": str,
+        "help": "Delete a Trello card from a specified list",
+    }),
+    (("--refresh-cache",), {
+        "action": "store_true",
+        "help": "Discard the cached list of Trello boards",
+    }),
+)
+
+# Flags and add_argument keyword arguments for each Jira action
+JIRA_ARGUMENTS: Tuple[Tuple[Tuple[str, ...], Dict[str, Any]], ...] = (
+    (("--issues",), {
+        "metavar": "PROJECT_KEY",
+        "type": str,
+        "nargs": "?",
+        "const": "default",
+        "help": "List all Jira issues for a specified project. \
+If no project is provided, uses default.",
+    }),
+    (("--projects",), {
+        "action": "store_true",
+        "help": "List all Jira projects",
+    }),
+    (("--add-issue",), {
+        "metavar": ("PROJECT_KEY", "ISSUE_TITLE"),
+        "nargs": "+",
+        "help": "Add a new Jira issue.",
+    }),
+    (("--add-issues",), {
+        "metavar": ("PROJECT_KEY", "ISSUE_TITLE"),
+        "nargs": "+",
+        "help": "Add several Jira issues to a project at once.",
+    }),
+    (("--update-issue",), {
+        "metavar": ("ISSUE_ID", "NEW_TITLE"),
+        "nargs": 2,
+        "type": str,
+        "help": "Update an existing Jira issue",
+    }),
+    (("--delete-issue",), {
+        "metavar": "ISSUE_ID",
+        "type": str,
+        "help": "Delete a Jira issue by issue ID",
+    }),
+    (("--delete-issues",), {
+        "metavar": "ISSUE_ID",
+        "nargs": "+",
+        "help": "Delete several Jira issues by issue ID at once",
+    }),
+    (("--add-project",), {
+        "metavar": ("PROJECT_NAME", "PROJECT_KEY"),
+        "nargs": 2,
+        "type": str,
+        "help": "Create a new Jira project",
+    }),
+    (("--delete-project",), {
+        "metavar": "PROJECT_KEY",
+        "type": str,
+        "help": "Delete a Jira project by project key",
+    }),
+    (("--project-type",), {
+        "choices": ("k", "s", "c", "b"),
+        "help": "Specify the type of a new Jira project: (k) Kanban, \
+(s) Simplified project management, (c) Scrum, or (b) Bug tracking",
+    }),
+    (("--type", "--issue-type"), {
+        "metavar": "ISSUE_TYPE",
+        "type": str,
+        "help": "Specify the issue type for a new Jira issue",
+    }),
+)
 
 def add_trello_arguments(parser: argparse.ArgumentParser) -> None:
     """
@@ -16,86 +171,10 @@ def add_trello_arguments(parser: argparse.ArgumentParser) -> None:
         parser (argparse.ArgumentParser):
             The argument parser to which Trello arguments will be added.
     """
-    parser.add_argument(
-        "--trello",
-        "--t",
-        help="Use Trello commands",
-        action="store_true"
-    )
-
     # Trello actions
     trello_actions = parser.add_argument_group('Trello Actions')
-    trello_actions.add_argument(
-        "--boards",
-        action="store_true",
-        help="List all Trello boards"
-    )
-    trello_actions.add_argument(
-        "--lists",
-        metavar="BOARD_NAME",
-        type=str,
-        help="List all Trello lists for a specified board"
-    )
-    trello_actions.add_argument(
-        "--cards",
-        metavar="LIST_ID",
-        type=str,
-        help="List all cards for a specified list by list ID"
-    )
-    trello_actions.add_argument(
-        "--add-board",
-        metavar="BOARD_NAME",
-        type=str,
-        help="Create a new Trello board"
-    )
-    trello_actions.add_argument(
-        "--add-list",
-        metavar=("BOARD_NAME", "LIST_NAME"),
-        nargs=2,
-        help="Create a new Trello list in a specified board"
-    )
-    trello_actions.add_argument(
-        "--add-card",
-        metavar=("LIST_NAME", "CARD_NAME"),
-        nargs=2,
-        help="Create a new Trello card in a specified list"
-    )
-    trello_actions.add_argument(
-        "--update-board",
-        metavar=("BOARD_ID", "NEW_NAME"),
-        nargs=2,
-        help="Update a Trello board"
-    )
-    trello_actions.add_argument(
-        "--update-list",
-        metavar=("LIST_ID", "NEW_NAME"),
-        nargs=2,
-        help="Update a Trello list"
-    )
-    trello_actions.add_argument(
-        "--update-card",
-        metavar=("CARD_ID", "NEW_NAME", "[DESCRIPTION]"),
-        nargs='+',
-        help="Update a Trello card. DESCRIPTION is optional."
-    )
-    trello_actions.add_argument(
-        "--delete-board",
-        metavar="BOARD_NAME",
-        type=str,
-        help="Delete a Trello board"
-    )
-    trello_actions.add_argument(
-        "--delete-list",
-        metavar="LIST_NAME",
-        type=str,
-        help="Delete a Trello list from a specified board"
-    )
-    trello_actions.add_argument(
-        "--delete-card",
-        metavar="CARD_NAME",
-        type=str,
-        help="Delete a Trello card from a specified list"
-    )
+    for flags, kwargs in TRELLO_ARGUMENTS:
+        trello_actions.add_argument(*flags, **kwargs)
 
 
 def add_jira_arguments(parser: argparse.ArgumentParser) -> None:
@@ -105,173 +184,283 @@ def add_jira_arguments(parser: argparse.ArgumentParser) -> None:
     Args:
         parser (argparse.ArgumentParser): The argument parser to which Jira arguments will be added.
     """
-    parser.add_argument(
-        "--jira",
-        "--j",
-        help="Use Jira commands",
-        action="store_true"
-    )
-
     # Jira actions
     jira_actions = parser.add_argument_group('Jira Actions')
-    jira_actions.add_argument(
-        "--issues",
-        metavar="PROJECT_KEY",
-        type=str,
-        nargs="?",
-        const="default",
-        help="List all Jira issues for a specified project. \
-If no project is provided, uses default."
-    )
-    jira_actions.add_argument(
-        "--projects",
-        action="store_true",
-        help="List all Jira projects"
-    )
-    jira_actions.add_argument(
-        "--add-issue",
-        metavar=("PROJECT_KEY", "ISSUE_TITLE"),
-        nargs="+",
-        help="Add a new Jira issue."
-    )
-    jira_actions.add_argument(
-        "--update-issue",
-        metavar=("ISSUE_ID", "NEW_TITLE"),
-        nargs=2,
-        type=str,
-        help="Update an existing Jira issue"
-    )
-    jira_actions.add_argument(
-        "--delete-issue",
-        metavar="ISSUE_ID",
-        type=str,
-        help="Delete a Jira issue by issue ID"
-    )
-    jira_actions.add_argument(
-        "--add-project",
-        metavar=("PROJECT_NAME", "PROJECT_KEY"),
-        nargs=2,
-        type=str,
-        help="Create a new Jira project"
-    )
-    jira_actions.add_argument(
-        "--delete-project",
-        metavar="PROJECT_KEY",
-        type=str,
-        help="Delete a Jira project by project key"
-    )
-    jira_actions.add_argument(
-        "--type",
-        "--issue-type",
-        metavar="ISSUE_TYPE",
-        type=str,
-        help="Specify the issue type for a new Jira issue"
-    )
-
-
-def parse_arguments() -> argparse.Namespace:
+    for flags, kwargs in JIRA_ARGUMENTS:
+        jira_actions.add_argument(*flags, **kwargs)
+
+
+# Option strings that select each command context
+TRELLO_FLAGS = ("--trello", "--t")
+JIRA_FLAGS = ("--jira", "--j")
+CONFIG_FLAGS = ("--config",)
+CONTEXT_FLAGS = frozenset(TRELLO_FLAGS + JIRA_FLAGS + CONFIG_FLAGS)
+
+# Parser description and argument builder for each context with its own actions
+CONTEXT_PARSERS = {
+    "trello": ("Trello-specific commands", add_trello_arguments),
+    "jira": ("Jira-specific commands", add_jira_arguments),
+}
+
+def scan_context(argv: List[str]) -> Tuple[Optional[str], List[str]]:
     """
-    Add command-line arguments for Atlas-Man.
+    Identify the command context with a plain scan over `argv`, without building a parser.
+    Trello takes precedence over Jira, and both take precedence over --config.
+
+    Args:
+        argv (List[str]): The command-line arguments, excluding the program name.
 
     Returns:
-        argparse.Namespace: Parsed command-line arguments.
+        Tuple[Optional[str], List[str]]:
+            The context ("trello", "jira", "config", or None) and the arguments
+            with all context flags removed.
     """
-    parser = argparse.ArgumentParser(description="A CLI to manage Trello and Jira projects")
-
-    # Add Trello and Jira arguments
-    add_trello_arguments(parser)
-    add_jira_arguments(parser)
+    context = None
+    for flags, name in ((TRELLO_FLAGS, "trello"), (JIRA_FLAGS, "jira"), (CONFIG_FLAGS, "config")):
+        if any(arg in flags for arg in argv):
+            context = name
+            break
+    remaining_args = [arg for arg in argv if arg not in CONTEXT_FLAGS]
+    return context, remaining_args
+
+@functools.lru_cache(maxsize=None)
+def context_parser(context: str) -> argparse.ArgumentParser:
+    """
+    Build the parser for a context's actions once per process; parsing does not mutate it,
+    so the same instance is reused by later calls.
 
-    return parser.parse_args()
+    Args:
+        context (str): A key of CONTEXT_PARSERS, e.g. "trello" or "jira".
 
-def validate_arguments(args: argparse.Namespace,
-                    remaining_args: List[str],
-                    trello_commands: TrelloCommands,
-                    jira_commands: JiraCommands) -> Tuple[argparse.Namespace, List[str]]:
+    Returns:
+        argparse.ArgumentParser: The parser for the given context.
+    """
+    import argparse # pylint: disable=import-outside-toplevel
+    import shutil # pylint: disable=import-outside-toplevel
+
+    description, add_arguments = CONTEXT_PARSERS[context]
+
+    # Option strings are only matched exactly (aliases like --t are registered explicitly),
+    # so argparse resolves each flag with a dict lookup instead of a linear prefix scan.
+    # This also keeps the parser in agreement with the exact-match scan in scan_context.
+    # argparse builds a HelpFormatter for every add_argument call (to validate metavars)
+    # and each one queries the terminal size; query it once for the whole parser instead.
+    formatter_class = functools.partial(argparse.HelpFormatter,
+                                        width=shutil.get_terminal_size().columns - 2)
+
+    # The context flag is stripped before parsing, so show it as part of the program name
+    prog = f"{os.path.basename(sys.argv[0])} --{context}"
+
+    parser = argparse.ArgumentParser(prog=prog,
+                                     description=description,
+                                     formatter_class=formatter_class,
+                                     allow_abbrev=False)
+    add_arguments(parser)
+    return parser
+
+@functools.lru_cache(maxsize=None)
+def context_help(context: str) -> str:
     """
-    Validate arguments based on Trello or Jira context and return parsed arguments and any unknowns.
+    Format a context parser's help once per process.
 
     Args:
-        args (argparse.Namespace): Parsed arguments from the initial context check.
-        remaining_args (List[str]): Remaining arguments to be parsed in context.
+        context (str): A key of CONTEXT_PARSERS, e.g. "trello" or "jira".
 
     Returns:
-        Tuple[argparse.Namespace, List[str]]:
-            Parsed context-specific arguments and any unrecognized arguments.
+        str: The formatted help text.
     """
-    if args.trello:
-        # Parse Trello-specific commands
-        trello_parser = argparse.ArgumentParser(description="Trello-specific commands")
-        add_trello_arguments(trello_parser)
-        trello_args, unknown = trello_parser.parse_known_args(remaining_args)
-
-        # handle empty arguments
-        if all(not value for value in vars(trello_args).values()):
-            print("Remaining args before parsing:", remaining_args)
-            trello_parser.print_help()
-            return trello_args, unknown
-
-        if unknown:
-            print(f"Error: Unrecognized arguments for Trello: {' '.join(unknown)}")
-            trello_parser.print_help()
-            return trello_args, unknown
-
-        try:
-            trello_commands.handle_trello_commands(trello_args)
-        except TypeError as e:
-            print(f"Error: {str(e)}")
-            trello_parser.print_help()
-            return trello_args, []
-        return trello_args, []
-
-    elif args.jira:
-        # Parse Jira-specific commands
-        jira_parser = argparse.ArgumentParser(description="Jira-specific commands")
-        add_jira_arguments(jira_parser)
-        jira_args, unknown = jira_parser.parse_known_args(remaining_args)
-
-        # handle empty arguments
-        if all(not value for value in vars(jira_args).values()):
-            jira_parser.print_help()
-            return jira_args, unknown
-
-        if unknown:
-            print(f"Error: Unrecognized arguments for Jira: {' '.join(unknown)}")
-            jira_parser.print_help()
-            return jira_args, unknown
-
-        try:
-            jira_commands.handle_jira_commands(jira_args)
-        except TypeError as e:
-            print(f"Error: {str(e)}")
-            jira_parser.print_help()
-            return jira_args, []
-        return jira_args, []
-
-    elif args.config:
-        # Edit the configuration file in the default editor
-        edit_config()
-
-        return args, remaining_args
+    return context_parser(context).format_help()
 
+def print_help(context: Optional[str]) -> None:
+    """
+    Print the help for a context, or the top-level help if the context has no parser.
+
+    Args:
+        context (Optional[str]): The context found by scan_context.
+    """
+    if context in CONTEXT_PARSERS:
+        sys.stdout.write(context_help(context))
     else:
+        sys.stdout.write(HELP_TEXT)
+
+def check_context_arguments(context: str,
+                            name: str,
+                            args: argparse.Namespace,
+                            unknown: List[str]) -> bool:
+    """
+    Check that a context's arguments select an action and contain nothing unrecognized,
+    printing the context's help otherwise.
+
+    Args:
+        context (str): A key of CONTEXT_PARSERS, e.g. "trello" or "jira".
+        name (str): The display name of the context, used in error messages.
+        args (argparse.Namespace): Arguments parsed by the context's parser.
+        unknown (List[str]): Arguments not recognized for the context.
+
+    Returns:
+        bool: True if the selected command should be run.
+    """
+    # handle empty arguments
+    if all(not value for value in vars(args).values()):
+        print_help(context)
+        return False
+
+    if unknown:
+        print(f"Error: Unrecognized arguments for {name}: {' '.join(unknown)}")
+        print_help(context)
+        return False
+
+    return True
+
+def handle_trello_context(args: Optional[argparse.Namespace],
+                          unknown: List[str],
+                          config: Dict[str, Any]) -> Tuple[Optional[argparse.Namespace], List[str]]:
+    """
+    Validate Trello arguments and run the selected Trello command.
+
+    Args:
+        args (Optional[argparse.Namespace]): Arguments parsed by the Trello parser.
+        unknown (List[str]): Arguments not recognized for Trello.
+        config (Dict[str, Any]): The loaded configuration.
+
+    Returns:
+        Tuple[Optional[argparse.Namespace], List[str]]:
+            Parsed Trello arguments and any unrecognized arguments.
+    """
+    if not check_context_arguments("trello", "Trello", args, unknown):
+        return args, unknown
+
+    try:
+        from atlasman.trello_commands import TrelloCommands # pylint: disable=import-outside-toplevel
+        TrelloCommands(config).handle_trello_commands(args)
+    except TypeError as e:
+        print(f"Error: {str(e)}")
+        print_help("trello")
+    return args, []
+
+def handle_jira_context(args: Optional[argparse.Namespace],
+                        unknown: List[str],
+                        config: Dict[str, Any]) -> Tuple[Optional[argparse.Namespace], List[str]]:
+    """
+    Validate Jira arguments and run the selected Jira command.
+
+    Args:
+        args (Optional[argparse.Namespace]): Arguments parsed by the Jira parser.
+        unknown (List[str]): Arguments not recognized for Jira.
+        config (Dict[str, Any]): The loaded configuration.
+
+    Returns:
+        Tuple[Optional[argparse.Namespace], List[str]]:
+            Parsed Jira arguments and any unrecognized arguments.
+    """
+    if not check_context_arguments("jira", "Jira", args, unknown):
+        return args, unknown
+
+    try:
+        from atlasman.jira_commands import JiraCommands # pylint: disable=import-outside-toplevel
+        JiraCommands(config).handle_jira_commands(args)
+    except TypeError as e:
+        print(f"Error: {str(e)}")
+        print_help("jira")
+    return args, []
+
+def handle_config_context(args: Optional[argparse.Namespace],
+                          unknown: List[str],
+                          config: Dict[str, Any]) -> Tuple[Optional[argparse.Namespace], List[str]]:
+    """
+    Edit the configuration file in the default editor.
+
+    Args:
+        args (Optional[argparse.Namespace]): Unused; --config has no parser.
+        unknown (List[str]): Any other arguments given with --config.
+        config (Dict[str, Any]): Unused; the editor works on the file directly.
+
+    Returns:
+        Tuple[Optional[argparse.Namespace], List[str]]: None and any other arguments.
+    """
+    # pylint: disable=unused-argument
+    edit_config()
+    return None, unknown
+
+# Handler for each command context, looked up by validate_arguments
+CONTEXT_HANDLERS = {
+    "trello": handle_trello_context,
+    "jira": handle_jira_context,
+    "config": handle_config_context,
+}
+
+def validate_arguments(context: Optional[str],
+                    args: Optional[argparse.Namespace],
+                    unknown: List[str],
+                    config: Dict[str, Any]) -> Tuple[Optional[argparse.Namespace], List[str]]:
+    """
+    Validate arguments based on Trello or Jira context and handle the selected command.
+
+    The command modules are imported by each context's handler, so that only the
+    selected backend's client library and client are set up.
+
+    Args:
+        context (Optional[str]): The context found by scan_context.
+        args (Optional[argparse.Namespace]): Arguments parsed by the context's parser, if any.
+        unknown (List[str]): Arguments not recognized for the context.
+        config (Dict[str, Any]): The loaded configuration, passed to the selected backend.
+
+    Returns:
+        Tuple[Optional[argparse.Namespace], List[str]]:
+            Parsed context-specific arguments and any unrecognized arguments.
+    """
+    handler = CONTEXT_HANDLERS.get(context)
+    if handler is None:
         # print help if no context is provided
+        import argparse # pylint: disable=import-outside-toplevel
         raise argparse.ArgumentError(argument=None,
                                      message="No arguments provided.")
 
-def main() -> None:
+    return handler(args, unknown, config)
+
+def package_version() -> str:
     """
-    The main function that serves as the entry point for the CLI.
+    Look up the installed package version from its metadata.
+
+    Returns:
+        str: The version from setup.cfg, or "unknown" when running from an uninstalled checkout.
     """
+    from importlib import metadata # pylint: disable=import-outside-toplevel
+
     try:
-        # Initial parser to identify the command context
-        parser = argparse.ArgumentParser(description="A CLI to manage Trello and Jira projects")
-        parser.add_argument("--trello", "--t", help="Use Trello commands", action="store_true")
-        parser.add_argument("--jira", "--j", help="Use Jira commands", action="store_true")
-        parser.add_argument("--config", help="Edit the configuration file", action="store_true")
+        return metadata.version("atlas-man")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+def main_impl() -> int:
+    """
+    Parse the command line and run the selected command.
+
+    Returns:
+        int: The process exit code.
+    """
+    argv = sys.argv[1:]
 
-        # Parse initial command context
-        args, remaining_args = parser.parse_known_args()
+    # Print help or the version without building a parser or loading the configuration
+    if not argv or argv[0] in ("-h", "--help"):
+        sys.stdout.write(HELP_TEXT)
+        return 0
+    if argv[0] == "--version":
+        sys.stdout.write(f"atlasman {package_version()}\n")
+        return 0
+
+    import argparse # pylint: disable=import-outside-toplevel
+
+    # Identify the command context; only that context's parser is ever built
+    context, remaining_args = scan_context(argv)
+    parser = context_parser(context) if context in CONTEXT_PARSERS else None
+    args = None
+    unknown = remaining_args
+
+    try:
+        # Parse the context's arguments before any configuration is loaded
+        if parser:
+            args, unknown = parser.parse_known_args(remaining_args)
 
         # Load configuration and pass necessary values to command handlers
         config = load_config()
@@ -281,29 +470,40 @@ def main() -> None:
         verbose = cli_config.get("verbose", False)
         if verbose:
             print("Running in verbose mode...")
-
-        # Initialize TrelloCommands and JiraCommands
-        trello_commands = TrelloCommands(config)
-        jira_commands = JiraCommands(config)
+            import logging # pylint: disable=import-outside-toplevel
+            logging.basicConfig()
+            logging.getLogger("atlasman").setLevel(logging.DEBUG)
 
         # Validate arguments based on context and handle commands
-        validated_args = validate_arguments(args, remaining_args, trello_commands, jira_commands)
-
-        if not validated_args:
-            parser.print_help()
+        validate_arguments(context, args, unknown, config)
 
     except (argparse.ArgumentError, TypeError) as e:
         print(f"Parsing Error: {str(e)}")
-        if args.trello:
+        if context == "trello":
             print("Please check the Trello-specific syntax in README.md.\n")
-        elif args.jira:
+        elif context == "jira":
             print("Please check the Jira-specific syntax in README.md.\n")
-        parser.print_help()
-    except Exception as e: # pylint: disable=broad-except
-        print(f"An unexpected error occurred: {str(e)}")
-        raise
+        print_help(context)
+        return 2
+
+    return 0
+
+def main() -> None:
+    """
+    The main function that serves as the entry point for the CLI.
+    """
+    try:
+        sys.exit(main_impl())
     except KeyboardInterrupt:
         print("\n\nCanceled.")
+        sys.exit(130)
+    except Exception as e: # pylint: disable=broad-except
+        print(f"An unexpected error occurred: {str(e)}")
+        # Keep the traceback in verbose mode, as the command decorators do; the "atlasman"
+        # logger is named explicitly, since this module may run as __main__
+        import logging # pylint: disable=import-outside-toplevel
+        logging.getLogger("atlasman").debug("Unexpected error", exc_info=True)
+        sys.exit(1)
 
 if __name__ == "__main__":
     main()
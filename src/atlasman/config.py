@@ -6,20 +6,37 @@ This module provides functionality to manage the configuration file located at
 settings for both Trello and Jira integrations, as well as CLI preferences.
 """
 
+import copy
+import functools
 import json
 import os
+import shlex
+import stat
+import subprocess
+import tempfile
 from typing import Any, Dict, Optional
 
+# Parse with orjson when it is installed; json.loads accepts the same bytes input
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 # Define the path to the configuration file
 CONFIG_DIR = os.path.expanduser("~/.config/atlas-man")
 CONFIG_FILE = os.path.join(CONFIG_DIR, "config.json")
 
+# Define the path to the directory for cached API responses
+CACHE_DIR = os.path.expanduser("~/.cache/atlas-man")
+
 # Default configuration template
 DEFAULT_CONFIG = {
     "trello": {
         "api_key": "",
         "api_secret": "",
         "oauth_token": "",
+        "max_retries": 3,
+        "concurrency": 4,
         "alias_ids": {
             "shopping": {
                 "board_id": "",
@@ -38,6 +55,9 @@ DEFAULT_CONFIG = {
         "default_project_key": "",
         "default_issue_type": "",
         "show_done_issues": False,
+        "requests_per_second": 10,
+        "max_retries": 3,
+        "concurrency": 4,
         "custom_status_order": {
             "To Do": 1,
             "In Progress": 2,
@@ -56,12 +76,18 @@ def edit_config() -> None:
     """
     Open the configuration file in the default editor for manual editing.
     """
-    os.system(f"{os.getenv('EDITOR', 'vi')} {CONFIG_FILE}")
+    # Run the editor directly rather than through a shell; $EDITOR may include arguments
+    editor = shlex.split(os.getenv('EDITOR', 'vi'))
+    subprocess.run([*editor, CONFIG_FILE], check=False)
+    load_config.cache_clear()
 
+@functools.lru_cache(maxsize=1)
 def load_config() -> Dict[str, Any]:
     """
     Load the configuration file. If the file does not exist, create it with default values.
     If the file is malformed, prompt the user to fix it or reset to default.
+    The result is memoized as a per-process snapshot; edit_config() and set_config_value()
+    clear it so that later calls read the updated file.
 
     Returns:
         Dict[str, Any]: A dictionary with configuration settings.
@@ -70,11 +96,11 @@ def load_config() -> Dict[str, Any]:
     if not os.path.exists(CONFIG_FILE):
         print(f"Configuration file not found. Creating a new one at {CONFIG_FILE}.")
         save_config(DEFAULT_CONFIG)
-        return DEFAULT_CONFIG
+        return copy.deepcopy(DEFAULT_CONFIG)
 
     try:
-        with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+        with open(CONFIG_FILE, 'rb') as f:
+            config = _json_loads(f.read())
         # Check if config is complete; if not, update with defaults
         return _update_with_defaults(config)
     except json.JSONDecodeError as exc:
@@ -83,28 +109,53 @@ def load_config() -> Dict[str, Any]:
             "Would you like to reset the configuration to default? (y/n): ").strip().lower()
         if choice == 'y':
             save_config(DEFAULT_CONFIG)
-            return DEFAULT_CONFIG
-        else:
-            raise ValueError(
-                f"Please correct the configuration file format at {CONFIG_FILE}") from exc
+            return copy.deepcopy(DEFAULT_CONFIG)
+        raise ValueError(
+            f"Please correct the configuration file format at {CONFIG_FILE}") from exc
 
 def save_config(config: Dict[str, Any]) -> None:
     """
     Save the configuration dictionary to the configuration file in JSON format.
     Ensure that the configuration directory exists before saving.
+    The file is left untouched if its contents would not change; otherwise it is written
+    to a temporary file first and moved into place, so a failed write cannot truncate it.
+    The saved file keeps the permissions of the file it replaces, and a new file is only
+    readable by its owner, since it holds API tokens.
 
     Args:
         config (Dict[str, Any]): The configuration dictionary to be saved.
     """
+    contents = json.dumps(config, indent=4)
+    # Compare bytes, so that a file which is not valid UTF-8 is simply overwritten
+    try:
+        with open(CONFIG_FILE, 'rb') as f:
+            if f.read() == contents.encode('utf-8'):
+                return
+    except OSError:
+        pass
+
     os.makedirs(CONFIG_DIR, exist_ok=True)
-    with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
-        json.dump(config, f, indent=4)
+    # mkstemp picks an unused name and creates the file with mode 0600
+    fd, temp_file = tempfile.mkstemp(dir=CONFIG_DIR, prefix="config.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(contents)
+        try:
+            os.chmod(temp_file, stat.S_IMODE(os.stat(CONFIG_FILE).st_mode))
+        except FileNotFoundError:
+            pass
+        os.replace(temp_file, CONFIG_FILE)
+    except BaseException:
+        os.unlink(temp_file)
+        raise
     print(f"Configuration saved to {CONFIG_FILE}.")
 
 def _update_with_defaults(config: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Update a configuration dictionary with missing default values.
-    
+    Update a configuration dictionary in place with missing default values.
+    Defaults are deep-copied, so the result never shares dictionaries with DEFAULT_CONFIG,
+    and the file is only rewritten if something was added.
+
     Args:
         config (Dict[str, Any]): The configuration dictionary to check and update.
 
@@ -112,22 +163,27 @@ def _update_with_defaults(config: Dict[str, Any]) -> Dict[str, Any]:
         Dict[str, Any]: The updated configuration dictionary with default values filled in.
     """
 
-    updated_config = DEFAULT_CONFIG.copy()
+    changed = False
     for section, defaults in DEFAULT_CONFIG.items():
-        if section in config:
-            if isinstance(config[section], dict):
-                # Only update missing keys within the section
-                updated_config[section].update(
-                    {k: config[section].get(k, v) for k, v in defaults.items()})
-            else:
+        section_config = config.get(section)
+        if not isinstance(section_config, dict):
+            if section in config:
                 print(f"Warning: Expected '{section}' to be a dictionary, resetting to default.")
-        else:
-            print(f"Warning: Missing configuration section '{section}', adding default.")
-    updated_config.update(config)
+            else:
+                print(f"Warning: Missing configuration section '{section}', adding default.")
+            config[section] = copy.deepcopy(defaults)
+            changed = True
+            continue
+
+        # Only add missing keys within the section
+        for key, value in defaults.items():
+            if key not in section_config:
+                section_config[key] = copy.deepcopy(value)
+                changed = True
 
-    if updated_config != config:
-        save_config(updated_config)
-    return updated_config
+    if changed:
+        save_config(config)
+    return config
 
 def get_config_value(section: str, key: str) -> Optional[Any]:
     """
@@ -157,3 +213,4 @@ def set_config_value(section: str, key: str, value: Any) -> None:
         config[section] = {}
     config[section][key] = value
     save_config(config)
+    load_config.cache_clear()
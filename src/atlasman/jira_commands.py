@@ -3,27 +3,94 @@ This module provides functions to interact with the Jira API.
 """
 
 import argparse
-import traceback
-from typing import Any, Dict
+import functools
+import hashlib
+import logging
+import os
+import shelve
+import sys
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple
+from urllib.parse import urlparse
 from jira import Issue, JIRA, JIRAError
 from tabulate import tabulate
-from .constants.jira_field_types import JIRA_FIELD_TYPES
+from .config import CACHE_DIR
+from .constants import jira_field_types
+from .jira_helpers import FIELD_PROMPTS, RateLimitedAdapter, RateLimiter, map_concurrently
+
+logger = logging.getLogger(__name__)
+
+# Number of issues requested per search page; servers may return fewer per page
+ISSUE_PAGE_SIZE = 500
+
+# JQL query listing the issues of a project, formatted with a quoted project key
+PROJECT_ISSUES_JQL = "project = {}"
+
+# JQL clause excluding finished issues; unlike a status name, the category always exists
+DONE_ISSUES_FILTER_JQL = " AND statusCategory != Done"
+
+# JQL clause ordering issues by status and then by key, which also keeps pages stable
+ISSUES_ORDER_JQL = " ORDER BY status ASC, key ASC"
+
+def quote_jql(value: str) -> str:
+    """
+    Quote a value as a JQL string literal, escaping backslashes and double quotes
+    so that the value cannot end the literal early.
+
+    Args:
+        value (str): The value to quote.
+
+    Returns:
+        str: The quoted JQL literal.
+    """
+    return '"' + value.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+# Project template key for each project type choice offered by add_project
+PROJECT_TEMPLATES = {
+    "k": "com.pyxis.greenhopper.jira:gh-simplified-agility-kanban",
+    "s": "com.atlassian.jira-core-project-templates:jira-core-simplified-project-management",
+    "c": "com.pyxis.greenhopper.jira:gh-simplified-agility-scrum",
+    "b": "com.atlassian.jira.jira-software-project-templates:jira-software-bug-tracking",
+}
+
+# Shelf of createmeta responses, keyed by Jira account, project key and issue type
+CREATEMETA_CACHE_FILE = os.path.join(CACHE_DIR, "createmeta")
+
+# Seconds for which cached createmeta responses are reused
+CREATEMETA_CACHE_TTL = 900
+
+# Number of projects requested per project search page
+PROJECT_PAGE_SIZE = 50
 
 # Decorator to handle common Jira-related exceptions
 def handle_jira_exceptions(func):
     """
     A decorator to handle common Jira-related exceptions.
+    Requests rejected with 429 are already retried by the Jira client's session,
+    honouring Retry-After.
+    Errors are reported in one line; details and tracebacks are logged at debug level.
     """
-    def wrapper(*args, **kwargs):
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
         try:
-            return func(*args, **kwargs)
+            return func(self, *args, **kwargs)
         except JIRAError as e:
-            print(f"JIRA error: {e}")
+            if e.status_code == 429:
+                retry_after = None
+                if e.response is not None:
+                    retry_after = e.response.headers.get("Retry-After")
+                print("JIRA error: Rate limit exceeded after retrying.",
+                      f"Try again in {retry_after or 'a few'} seconds.")
+                return None
+            print(f"JIRA error {e.status_code}: {e.text}")
+            # The full error lists request and response headers, so only log it when debugging
+            logger.debug("%s", e)
         except ValueError as e:
             print(f"Value error: {e}")
         except Exception as e:  # pylint: disable=broad-except
             print(f"Unexpected error in {func.__qualname__}: {e}")
-            traceback.print_exc()
+            logger.debug("Unexpected error in %s", func.__qualname__, exc_info=True)
+        return None
     return wrapper
 
 
@@ -32,6 +99,8 @@ class JiraCommands:
     The JiraCommands class provides functions to interact with the Jira API.
     """
 
+    __slots__ = ("config", "default_project_key", "_client", "rate_limiter", "dispatch")
+
     def __init__(self, config_data: Dict[str, Any]) -> None:
         """
         Initializes the JiraCommands class with the given configuration.
@@ -42,7 +111,37 @@ class JiraCommands:
         """
 
         self.config: Dict[str, Any] = config_data
-        self.client: JIRA = self.initialize_jira_client()
+        self.default_project_key: str | None = \
+            self.config.get("jira", {}).get("default_project_key")
+        self._client: JIRA | None = None
+        self.rate_limiter = RateLimiter(
+            self.config.get("jira", {}).get("requests_per_second", 10))
+
+        # Maps each Jira action's argparse dest to its handler, in order of precedence
+        self.dispatch: Dict[str, Callable[[argparse.Namespace], None]] = {
+            "issues": self._handle_issues,
+            "projects": self._handle_projects,
+            "add_issue": self._handle_add_issue,
+            "add_issues": self._handle_add_issues,
+            "update_issue": self._handle_update_issue,
+            "delete_issue": self._handle_delete_issue,
+            "delete_issues": self._handle_delete_issues,
+            "add_project": self._handle_add_project,
+            "delete_project": self._handle_delete_project,
+        }
+
+    @property
+    def client(self) -> JIRA:
+        """
+        The Jira client, created on first use so that commands which never reach
+        the Jira API do not pay for connecting to it.
+
+        Returns:
+            JIRA: The memoized Jira client.
+        """
+        if self._client is None:
+            self._client = self.initialize_jira_client()
+        return self._client
 
     def initialize_jira_client(self) -> JIRA:
         """
@@ -63,74 +162,245 @@ class JiraCommands:
             raise ValueError("Missing required Jira credentials ",
                              "(base_url, username, or api_token) in the configuration file.")
 
+        # Jira Cloud sites are always on atlassian.net, so the serverInfo request made to
+        # detect the deployment type can be skipped for them
+        hostname = urlparse(base_url).hostname or ""
+        is_cloud = hostname.endswith(".atlassian.net")
+
         # Initialize JIRA client with API token for basic auth
-        return JIRA(server=base_url, basic_auth=(username, api_token))
+        client = JIRA(server=base_url,
+                      basic_auth=(username, api_token),
+                      get_server_info=not is_cloud,
+                      max_retries=config_jira.get("max_retries", 3))
+        if is_cloud:
+            client.deploymentType = "Cloud"
+
+        # The session already keeps connections alive and retries failed requests; size its
+        # connection pool so that concurrent fetches do not open and discard extra connections,
+        # and pace every request it sends with the instance's rate limiter
+        pool_size = max(config_jira.get("concurrency", 4), 10)
+        adapter = RateLimitedAdapter(self.rate_limiter,
+                                     pool_connections=pool_size,
+                                     pool_maxsize=pool_size)
+        client._session.mount("https://", adapter) # pylint: disable=protected-access
+        client._session.mount("http://", adapter) # pylint: disable=protected-access
+        return client
+
+    def _first_board_id(self, project_key: str) -> int | None:
+        """
+        Returns the ID of the first board of a project.
+        Only one board is requested, since only the first is used.
+
+        Args:
+            project_key (str): The key of the project.
+
+        Returns:
+            int | None: The ID of the project's first board, or None if it has no boards.
+        """
+        boards = self.client.boards(maxResults=1, projectKeyOrID=project_key)
+        return boards[0].id if boards else None
+
+    def _createmeta_cache_account(self) -> str:
+        """
+        Returns an identifier of the configured Jira site and user, so that createmeta cached
+        for a project on one site is never used for a project with the same key on another.
+
+        Returns:
+            str: A SHA-256 digest of the base URL and username.
+        """
+        config_jira = self.config.get("jira", {})
+        account = f"{config_jira.get('base_url')}:{config_jira.get('username')}"
+        return hashlib.sha256(account.encode()).hexdigest()
+
+    def _get_createmeta(self, project_key: str, issue_type: str) -> Dict[str, Any]:
+        """
+        Returns the create metadata, including field schemas, for an issue type in a project.
+        Responses are kept on disk for CREATEMETA_CACHE_TTL seconds, since they rarely change
+        and are expensive to fetch; if the cache cannot be used, the metadata is fetched.
+        Cached responses are scoped to the configured Jira site and user.
+
+        Args:
+            project_key (str): The key of the project.
+            issue_type (str): The name of the issue type.
+
+        Returns:
+            Dict[str, Any]: The createmeta response.
+        """
+        cache_key = f"{self._createmeta_cache_account()}/{project_key}/{issue_type}"
+        try:
+            with shelve.open(CREATEMETA_CACHE_FILE, flag='r') as cache:
+                cached = cache.get(cache_key)
+            if cached and cached[0] > time.time():
+                return cached[1]
+        except Exception:  # pylint: disable=broad-except
+            # A missing or unreadable shelf is a cache miss
+            pass
+
+        data = self.client.createmeta(
+            projectKeys=project_key,
+            issuetypeNames=issue_type,
+            expand='projects.issuetypes.fields'
+        )
+
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            with shelve.open(CREATEMETA_CACHE_FILE) as cache:
+                cache[cache_key] = (time.time() + CREATEMETA_CACHE_TTL, data)
+        except Exception:  # pylint: disable=broad-except
+            logger.debug("Could not write %s", CREATEMETA_CACHE_FILE, exc_info=True)
+        return data
+
+    def _fetch_projects(self) -> List[Tuple[str, str]]:
+        """
+        Fetches the name and key of all projects. Jira Cloud is paged through
+        `project/search` ordered by key, without expanded fields; Jira Server and Data Center
+        lack that endpoint, so they return all projects from `project` at once.
+
+        Returns:
+            List[Tuple[str, str]]: The name and key of each project available in Jira.
+        """
+        if not self.client._is_cloud:  # pylint: disable=protected-access
+            return [(project.name, project.key) for project in self.client.projects()]
+
+        projects = []
+        start_at = 0
+        while True:
+            page = self.client._get_json(  # pylint: disable=protected-access
+                "project/search",
+                params={"startAt": start_at, "maxResults": PROJECT_PAGE_SIZE, "orderBy": "key"})
+            values = page.get("values", [])
+            projects.extend((project["name"], project["key"]) for project in values)
+            start_at += len(values)
+            if page.get("isLast", True) or not values:
+                return projects
+
+    def _normalize_issue_id(self, issue_id: str) -> str:
+        """
+        Normalizes an issue ID given either as a full key (e.g., 'ANT-123')
+        or as its numeric part (e.g., '123'), which is prefixed with the default project key.
+
+        Args:
+            issue_id (str): The ID or numeric part of the issue.
+
+        Returns:
+            str: The full issue key.
+        """
+        if '-' not in issue_id:
+            return f"{self.default_project_key}-{issue_id}"
+        return issue_id
+
+    def _map_concurrently(self, func: Callable[[Any], Any], items: Iterable[Any]) -> List[Any]:
+        """
+        Calls `func` on each item from a pool of `jira.concurrency` threads (default 4),
+        returning the results in the order of the items.
+        Requests from all threads are paced by the client's shared rate limiter.
+
+        Args:
+            func (Callable[[Any], Any]): The function to call for each item.
+            items (Iterable[Any]): The items to process.
+
+        Returns:
+            List[Any]: The result for each item.
+        """
+        # Create the client before starting threads so that they all share it
+        _ = self.client
+        return map_concurrently(func, items, self.config["jira"].get("concurrency", 4))
+
+    def _search_issue_pages(self, jql: str, fields: str) -> Iterator[List[Issue]]:
+        """
+        Yields pages of issues matching a JQL query, each holding up to ISSUE_PAGE_SIZE issues
+        with only the requested fields. Jira Cloud pages with `nextPageToken`, so its pages
+        are fetched one after another; Jira Server and Data Center page with `startAt`,
+        so pages after the first are fetched concurrently.
+
+        Args:
+            jql (str): The JQL query to search with.
+            fields (str): A comma-separated list of the issue fields to return.
+
+        Returns:
+            Iterator[List[Issue]]: The pages of matching issues.
+        """
+        if self.client._is_cloud:  # pylint: disable=protected-access
+            next_page_token = None
+            while True:
+                page = self.client.enhanced_search_issues(jql,
+                                                          nextPageToken=next_page_token,
+                                                          maxResults=ISSUE_PAGE_SIZE,
+                                                          fields=fields)
+                yield page
+                next_page_token = page.nextPageToken
+                if not next_page_token:
+                    return
+        else:
+            def _fetch(start_at: int) -> List[Issue]:
+                """Fetches the page of issues starting at `start_at`."""
+                return self.client.search_issues(jql,
+                                                 startAt=start_at,
+                                                 maxResults=ISSUE_PAGE_SIZE,
+                                                 fields=fields)
+
+            # The first page reports the total; the rest are then fetched concurrently.
+            # The server may cap the page size below ISSUE_PAGE_SIZE, so offsets step
+            # by the size of the first page.
+            first_page = _fetch(0)
+            yield first_page
+            page_size = len(first_page)
+            if page_size and page_size < first_page.total:
+                yield from self._map_concurrently(
+                    _fetch, range(page_size, first_page.total, page_size))
 
     @handle_jira_exceptions
     def list_projects(self) -> None:
         """
         Lists all projects available in Jira.
         """
-        projects = self.client.projects()
-        for project in projects:
-            print(f"Project Name: {project.name} - Project Key: {project.key}")
+        projects = self._fetch_projects()
+        # Write all rows at once rather than printing each project separately
+        sys.stdout.write("".join(
+            f"Project Name: {name} - Project Key: {key}\n" for name, key in projects))
 
     @handle_jira_exceptions
     def list_issues(self, project_key: str) -> None:
         """
-        Lists all issues for a specified project, sorted by status in a custom order.
+        Lists all issues for a specified project, sorted by status in the order configured
+        under jira -> custom_status_order.
 
         Args:
             project_key (str): The key of the project to list issues from.
         """
 
         print(f"Issues for {project_key}:")
-        issues = self.client.search_issues(f'project="{project_key}"')
-
-        # Custom order for statuses
-        status_order = {
-            "To Do": 1,
-            "In Progress": 2,
-            "Testing": 3,
-            "Done": 4
-        }
-
-        # Check if the response is a ResultList of Issue objects
-        if isinstance(issues, list) or hasattr(issues, 'total'):
-            # Collect issues in a list with their statuses for sorting
-            issue_list = []
-            for issue in issues:
-                if isinstance(issue, Issue):
-                    if issue.fields.status.name == "Done" and \
-                        not self.config["jira"]["show_done_issues"]:
-                        continue
-                    # Assign a sort index; default to 0 if not in the custom order
-                    status_index = status_order.get(issue.fields.status.name, 0)
-                    issue_list.append((status_index, issue.fields.status.name,
-                                       issue.key, issue.fields.summary))
-                else:
-                    print(f"Unexpected item type in issues list: {type(issue)}")
-
-            # Sort the issue list by the custom status index
-            issue_list.sort(key=lambda x: x[0])
-
-            # Create a table using tabulate
-            table = tabulate(
-                [(status, key, summary) for _, status, key, summary in issue_list],
-                headers=["Status", "Issue Key", "Summary"],
-                tablefmt="grid"
-            )
-            print(table)
-
-        elif isinstance(issues, dict):
-            print("Received response as dictionary. Inspecting keys for more details.")
-            for key, value in issues.items():
-                print(f"{key}: {value}")
-        else:
-            print("Unexpected issue format received from Jira API.")
+        # Only the fields shown in the table are requested, across all result pages, and
+        # finished issues are filtered out by the server unless they should be shown
+        jql = PROJECT_ISSUES_JQL.format(quote_jql(project_key))
+        if not self.config["jira"]["show_done_issues"]:
+            jql += DONE_ISSUES_FILTER_JQL
+        jql += ISSUES_ORDER_JQL
+
+        # JQL cannot sort by a custom status order, so the server returns issues grouped by
+        # status and by key, and the rows are then stably sorted by the configured order.
+        # The search pages always hold Issue objects, so rows need no per-item type checks
+        status_order = self.config["jira"].get("custom_status_order", {})
+        rows = [(issue.fields.status.name, issue.key, issue.fields.summary)
+                for page in self._search_issue_pages(jql, fields="summary,status")
+                for issue in page]
+        # Statuses missing from the custom order come first
+        rows.sort(key=lambda row: status_order.get(row[0], 0))
+
+        # Create a table using tabulate; every column is text, so cells are not parsed as numbers
+        table = tabulate(
+            rows,
+            headers=["Status", "Issue Key", "Summary"],
+            tablefmt="grid",
+            disable_numparse=True
+        )
+        print(table)
 
     @handle_jira_exceptions
-    def add_project(self, project_name: str, project_key: str) -> None:
+    def add_project(self,
+                    project_name: str,
+                    project_key: str,
+                    project_type: str | None = None) -> None:
         """
         Creates a new project with the specified name and key,
         allowing the user to choose a project type.
@@ -138,29 +408,23 @@ class JiraCommands:
         Args:
             project_name (str): The name of the project to create.
             project_key (str): The key for the project to create.
+            project_type (str, optional): The project type, one of the keys of
+                PROJECT_TEMPLATES. The user is prompted for it if it is not given.
         """
-        # Prompt the user for project type
-        project_type = input(
-            "Select the type of project to create:\n"
-            "(k) Kanban\n"
-            "(s) Simplified project management\n"
-            "(c) Scrum\n"
-            "(b) Bug tracking\n"
-            "Enter your choice (k/s/c/b): "
-        ).strip().lower()
-
-        # Determine the project template key based on user input
-        if project_type == 'k':
-            project_template_key = "com.pyxis.greenhopper.jira:gh-simplified-agility-kanban"
-        elif project_type == 's':
-            project_template_key = \
-                "com.atlassian.jira-core-project-templates:jira-core-simplified-project-management"
-        elif project_type == 'c':
-            project_template_key = "com.pyxis.greenhopper.jira:gh-simplified-agility-scrum"
-        elif project_type == 'b':
-            project_template_key = \
-                "com.atlassian.jira.jira-software-project-templates:jira-software-bug-tracking"
-        else:
+        if project_type is None:
+            # Prompt the user for project type
+            project_type = input(
+                "Select the type of project to create:\n"
+                "(k) Kanban\n"
+                "(s) Simplified project management\n"
+                "(c) Scrum\n"
+                "(b) Bug tracking\n"
+                "Enter your choice (k/s/c/b): "
+            )
+
+        # Determine the project template key based on the chosen type
+        project_template_key = PROJECT_TEMPLATES.get(project_type.strip().lower())
+        if project_template_key is None:
             print("Error: Invalid choice. Please enter 'k', 's', 'c', or 'b'.")
             return
 
@@ -181,10 +445,8 @@ class JiraCommands:
             base_url = self.config.get('jira', {}).get('base_url', "")
             if base_url:
                 # Fetch the board associated with the new project
-                boards = self.client.boards(projectKeyOrID=project_key)
-                if boards:
-                    # Assuming we take the first board if multiple are returned
-                    board_id = boards[0].id
+                board_id = self._first_board_id(project_key)
+                if board_id:
                     project_link = \
                         f"{base_url}/jira/software/projects/{project_key}/boards/{board_id}"
                     print(f"Project '{project_name}' created successfully with Key: {project_key}")
@@ -206,6 +468,54 @@ class JiraCommands:
             else:
                 raise  # Reraise other errors for the decorator to handle
 
+    def _parse_fields(self,
+                      errors: Dict[str, str],
+                      fields: Dict[str, Any],
+                      project_key: str,
+                      issue_type: str) -> None:
+        """
+        Handles required field errors by prompting the user for input.
+
+        Args:
+            errors (Dict[str, str]): The error message Jira returned for each missing field.
+            fields (Dict[str, Any]): The fields of the issue being created, updated in place.
+            project_key (str): The key of the project where the issue will be added.
+            issue_type (str): The type of the issue, e.g., "Story", "Task".
+        """
+        # Fetch the create metadata once for all missing custom fields, keeping the
+        # allowed values from the first issue type that defines each field
+        allowed_values_by_field: Dict[str, List[Dict[str, Any]]] = {}
+        if any('customfield_' in field for field in errors):
+            data = self._get_createmeta(project_key, issue_type)
+            for project in data.get("projects", []):
+                for issuetype in project.get("issuetypes", []):
+                    for field_id, field_meta in issuetype.get("fields", {}).items():
+                        allowed_values_by_field.setdefault(
+                            field_id, field_meta.get("allowedValues", []))
+
+        # Process each error field using _prompt_for_field
+        for field, message in errors.items():
+            self._prompt_for_field(field, message, fields, allowed_values_by_field)
+
+    def _prompt_for_field(self,
+                          field: str,
+                          message: str,
+                          fields: Dict[str, Any],
+                          allowed_values_by_field: Dict[str, List[Dict[str, Any]]]) -> None:
+        """
+        Prompts the user for a missing field based on its expected type.
+
+        Args:
+            field (str): The ID of the missing field.
+            message (str): The error message Jira returned for the field.
+            fields (Dict[str, Any]): The fields of the issue being created, updated in place.
+            allowed_values_by_field (Dict[str, List[Dict[str, Any]]]):
+                The allowed values of the project's custom fields.
+        """
+        expected_type = jira_field_types.JIRA_FIELD_TYPES.get(field, str)
+        prompt = FIELD_PROMPTS.get(expected_type, FIELD_PROMPTS[str])
+        fields[field] = prompt(field, message, allowed_values_by_field)
+
     def add_issue(self, project_key: str, issue_title: str, issue_type: str = 'Task') -> None:
         """
         Adds a new issue to the specified project.
@@ -231,60 +541,6 @@ class JiraCommands:
             'issuetype': {'name': issue_type}
         }
 
-        def _parse_fields(errors):
-            """Handles required field errors by prompting the user for input."""
-
-            def _prompt_for_field(field, message):
-                """Prompts the user for a missing field based on its expected type."""
-                expected_type = JIRA_FIELD_TYPES.get(field, str)
-
-                # Prompt based on expected type
-                if expected_type == int:
-                    value = int(input(
-                        f"Enter a number for {message.replace(' is required.', '')}: "))
-                elif expected_type == list:
-                    value = input(
-                        f"Enter values for {message.replace(
-                            ' is required.', '')} (comma-separated): ")
-                    value = [item.strip() for item in value.split(',')]
-                elif expected_type == dict:
-                    if 'issuetype' in field:
-                        # Special handling for issuetype fields if needed
-                        value = input("Enter an issue type: ").lower().capitalize()
-                    elif 'customfield_' in field:
-                        data = self.client.createmeta(
-                            projectKeys=project_key,
-                            issuetypeNames=issue_type,
-                            expand='projects.issuetypes.fields'
-                        )
-                        allowed_values = None
-                        for project in data.get("projects", []):
-                            for issuetype in project.get("issuetypes", []):
-                                available_fields = issuetype.get("fields", {})
-                                if field in available_fields:
-                                    allowed_values = available_fields[field].get(
-                                        "allowedValues", [])
-                                    break  # Stop after finding the first instance
-
-                        # Print or further process the allowed values for customfield
-                        if allowed_values:
-                            print("Enter an ID from the following:")
-                            for option in allowed_values:
-                                print(f"{option['id']} - {option['value']}")
-                            value = {"id": input("\n")}
-                else:
-                    # Default case for str or any unexpected type
-                    remove_chars = [' is required.', 'You must specify ', '.']
-                    for char in remove_chars:
-                        message = message.replace(char, '')
-                    value = input(f"Enter {message}: ")
-
-                fields[field] = value
-
-            # Process each error field using _prompt_for_field
-            for field, message in errors.items():
-                _prompt_for_field(field, message)
-
         try:
             new_issue = self.client.create_issue(fields=fields)
             print(f"{issue_type} '{new_issue.key}' created successfully in '{project_key}'.")
@@ -292,7 +548,7 @@ class JiraCommands:
         except JIRAError as e:
             if e.status_code == 400:
                 errors = e.response.json().get('errors', {})
-                _parse_fields(errors)  # Call the inner function to handle field parsing
+                self._parse_fields(errors, fields, project_key, issue_type)
 
                 # Retry creating the issue with additional required fields
                 new_issue = self.client.create_issue(fields=fields)
@@ -301,6 +557,44 @@ class JiraCommands:
             else:
                 print(f"Failed to create issue: {e}")
 
+    @handle_jira_exceptions
+    def add_issues(self,
+                   project_key: str,
+                   issue_titles: List[str],
+                   issue_type: str | None = None) -> None:
+        """
+        Adds several issues of the same type to the specified project, creating them
+        concurrently. Unlike add_issue, missing required fields are reported, not prompted for.
+
+        Args:
+            project_key (str): The key of the project where the issues will be added.
+            issue_titles (List[str]): The titles of the issues.
+            issue_type (str): The type of the issues, e.g., "Story", "Task".
+        """
+        if issue_type:
+            issue_type = issue_type.lower().capitalize()
+        else:
+            issue_type = self.config["jira"].get("default_issue_type") or "Task"
+
+        def _create(issue_title: str) -> Tuple[str | None, str | None]:
+            """Creates one issue, returning its key or the error that prevented it."""
+            try:
+                new_issue = self.client.create_issue(fields={
+                    'project': {'key': project_key},
+                    'summary': issue_title,
+                    'issuetype': {'name': issue_type}
+                })
+                return new_issue.key, None
+            except JIRAError as e:
+                return None, e.text
+
+        for issue_title, (issue_key, error) in zip(issue_titles,
+                                                   self._map_concurrently(_create, issue_titles)):
+            if issue_key:
+                print(f"{issue_type} '{issue_key}' created successfully in '{project_key}'.")
+            else:
+                print(f"Failed to create issue '{issue_title}': {error}")
+
     @handle_jira_exceptions
     def update_issue(self, issue_id: str, new_title: str) -> None:
         """
@@ -310,8 +604,11 @@ class JiraCommands:
             issue_id (str): The ID of the issue to update.
             new_title (str): The new title for the issue.
         """
-        issue = self.client.issue(issue_id)
-        issue.update(fields={"summary": new_title})
+        # PUT the new summary directly; fetching an Issue to call update() on it costs a GET
+        # before the PUT and another GET afterwards to reload the issue
+        self.client._session.put(  # pylint: disable=protected-access
+            self.client._get_url(f"issue/{issue_id}"),  # pylint: disable=protected-access
+            json={"fields": {"summary": new_title}})
         print(f"Issue '{issue_id}' updated successfully.")
 
     @handle_jira_exceptions
@@ -324,15 +621,10 @@ class JiraCommands:
             issue_id (str): The ID or numeric part of the issue to delete.
         """
         try:
-            # Normalize issue ID to handle either full key (e.g., 'ANT-123')
-            # or numeric part (e.g., '123')
-            if '-' not in issue_id:
-                # Assume it's only the numeric part and prepend the project key, if needed
-                project_key = self.config["jira"].get("default_project_key")
-                issue_id = f"{project_key}-{issue_id}"
-
-            # Fetch the issue using the normalized issue key
-            issue = self.client.issue(issue_id)
+            issue_id = self._normalize_issue_id(issue_id)
+
+            # Fetch the issue using the normalized issue key; only the title is shown
+            issue = self.client.issue(issue_id, fields="summary")
             issue_key = issue.key  # Full issue key, e.g., 'ANT-123'
             issue_title = issue.fields.summary  # Get the issue title for context
 
@@ -359,6 +651,58 @@ class JiraCommands:
             else:
                 raise  # Reraise other errors for the decorator to handle
 
+    @handle_jira_exceptions
+    def delete_issues(self, issue_ids: List[str]) -> None:
+        """
+        Deletes several issues by their IDs or numeric identifiers, concurrently, after a
+        single confirmation prompt requiring the user to enter the number of issues.
+
+        Args:
+            issue_ids (List[str]): The IDs or numeric parts of the issues to delete.
+        """
+        issue_ids = [self._normalize_issue_id(issue_id) for issue_id in issue_ids]
+
+        def _fetch(issue_id: str) -> Tuple[Issue | None, str | None]:
+            """Fetches one issue, returning it or the error that prevented it."""
+            try:
+                return self.client.issue(issue_id, fields="summary"), None
+            except JIRAError as e:
+                return None, e.text
+
+        issues = []
+        for issue_id, (issue, error) in zip(issue_ids, self._map_concurrently(_fetch, issue_ids)):
+            if issue:
+                issues.append(issue)
+            else:
+                print(f"Skipping issue '{issue_id}': {error}")
+        if not issues:
+            return
+
+        # Display warning and request confirmation for the whole batch
+        print("Warning: You are about to delete the following issues:")
+        for issue in issues:
+            print(f"  {issue.key}: {issue.fields.summary}")
+        confirmation_text = ("This action is irreversible.\n"
+                             f"To confirm deletion, please enter the number of issues "
+                             f"({len(issues)}): ")
+        if input(confirmation_text).strip() != str(len(issues)):
+            print("Deletion canceled: Number of issues did not match.")
+            return
+
+        def _delete(issue: Issue) -> str | None:
+            """Deletes one issue, returning the error that prevented it, if any."""
+            try:
+                issue.delete()
+                return None
+            except JIRAError as e:
+                return e.text
+
+        for issue, error in zip(issues, self._map_concurrently(_delete, issues)):
+            if error:
+                print(f"Failed to delete issue '{issue.key}': {error}")
+            else:
+                print(f"Issue '{issue.key}' deleted successfully.")
+
     @handle_jira_exceptions
     def delete_project(self, project_key: str) -> None:
         """
@@ -397,51 +741,105 @@ class JiraCommands:
             else:
                 raise  # Reraise other errors for the decorator to handle
 
+    def _handle_issues(self, args: argparse.Namespace) -> None:
+        """
+        Handle `--issues`, using the default project if no specific project key is provided.
+
+        Args:
+            args (argparse.Namespace): The parsed command-line arguments.
+        """
+        project_key = self.default_project_key if args.issues == "default" else args.issues
+        if project_key:
+            self.list_issues(project_key)
+        else:
+            print("Error: No project key provided,",
+                  "and no default project set in configuration.")
+
+    def _handle_projects(self, _: argparse.Namespace) -> None:
+        """
+        Handle `--projects`.
+        """
+        self.list_projects()
+
+    def _handle_add_issue(self, args: argparse.Namespace) -> None:
+        """
+        Handle `--add-issue`, which takes either a title or a project key and a title.
+
+        Args:
+            args (argparse.Namespace): The parsed command-line arguments.
+        """
+        # Check if one or two arguments were provided for --add-issue
+        if len(args.add_issue) == 1:
+            # Use default project and provided title
+            project_key = self.default_project_key
+            issue_title = args.add_issue[0]
+        elif len(args.add_issue) < 3:
+            # Use provided project key and title
+            project_key = args.add_issue[0]
+            issue_title = args.add_issue[1]
+        else:
+            raise TypeError("Invalid number of arguments for --add-issue.\n")
+
+        # Ensure project key is available before proceeding
+        if project_key:
+            self.add_issue(project_key, issue_title, issue_type=args.type)
+        else:
+            print("Error: No project key provided,",
+                  "and no default project set in configuration.")
+
+    def _handle_add_issues(self, args: argparse.Namespace) -> None:
+        """
+        Handle `--add-issues PROJECT_KEY ISSUE_TITLE [ISSUE_TITLE ...]`.
+
+        Args:
+            args (argparse.Namespace): The parsed command-line arguments.
+        """
+        if len(args.add_issues) < 2:
+            raise TypeError("--add-issues requires a project key and at least one title.\n")
+        self.add_issues(args.add_issues[0], args.add_issues[1:], issue_type=args.type)
+
+    def _handle_update_issue(self, args: argparse.Namespace) -> None:
+        """
+        Handle `--update-issue ISSUE_ID NEW_TITLE`.
+        """
+        self.update_issue(args.update_issue[0], args.update_issue[1])
+
+    def _handle_delete_issue(self, args: argparse.Namespace) -> None:
+        """
+        Handle `--delete-issue ISSUE_ID`.
+        """
+        self.delete_issue(args.delete_issue)
+
+    def _handle_delete_issues(self, args: argparse.Namespace) -> None:
+        """
+        Handle `--delete-issues ISSUE_ID [ISSUE_ID ...]`.
+        """
+        self.delete_issues(args.delete_issues)
+
+    def _handle_add_project(self, args: argparse.Namespace) -> None:
+        """
+        Handle `--add-project PROJECT_NAME PROJECT_KEY [--project-type TYPE]`.
+        """
+        self.add_project(args.add_project[0], args.add_project[1],
+                         project_type=args.project_type)
+
+    def _handle_delete_project(self, args: argparse.Namespace) -> None:
+        """
+        Handle `--delete-project PROJECT_KEY`.
+        """
+        self.delete_project(args.delete_project)
+
     def handle_jira_commands(self, args: argparse.Namespace) -> None:
         """
         Handle Jira commands based on the provided arguments.
 
+        The first action set, in `self.dispatch` order, is dispatched to its handler.
+
         Args:
             args (argparse.Namespace): The parsed command-line arguments.
         """
 
-        if args.issues:
-            # Use the default project if no specific project key is provided
-            if args.issues == "default":
-                project_key = self.config["jira"].get("default_project_key")
-            else:
-                project_key = args.issues
-            if project_key:
-                self.list_issues(project_key)
-            else:
-                print("Error: No project key provided,",
-                      "and no default project set in configuration.")
-        elif args.projects:
-            self.list_projects()
-        elif args.add_issue:
-            # Check if one or two arguments were provided for --add-issue
-            if len(args.add_issue) == 1:
-                # Use default project and provided title
-                project_key = self.config["jira"].get("default_project_key")
-                issue_title = args.add_issue[0]
-            elif len(args.add_issue) < 3:
-                # Use provided project key and title
-                project_key = args.add_issue[0]
-                issue_title = args.add_issue[1]
-            else:
-                raise TypeError("Invalid number of arguments for --add-issue.\n")
-
-            # Ensure project key is available before proceeding
-            if project_key:
-                self.add_issue(project_key, issue_title, issue_type=args.type)
-            else:
-                print("Error: No project key provided,",
-                      "and no default project set in configuration.")
-        elif args.update_issue:
-            self.update_issue(args.update_issue[0], args.update_issue[1])
-        elif args.delete_issue:
-            self.delete_issue(args.delete_issue)
-        elif args.add_project:
-            self.add_project(args.add_project[0], args.add_project[1])
-        elif args.delete_project:
-            self.delete_project(args.delete_project)
+        for dest, handler in self.dispatch.items():
+            if getattr(args, dest, None):
+                handler(args)
+                return
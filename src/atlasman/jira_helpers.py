@@ -0,0 +1,177 @@
+"""
+Helpers for the Jira commands: pacing and concurrently issuing Jira API requests,
+and prompting for the fields Jira requires to create an issue.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List
+from requests.adapters import HTTPAdapter
+
+class RateLimiter:  # pylint: disable=too-few-public-methods
+    """
+    Spaces out calls so that no more than `requests_per_second` start in any second.
+    Safe to share between threads.
+    """
+
+    __slots__ = ("interval", "next_allowed_time", "lock")
+
+    def __init__(self, requests_per_second: float) -> None:
+        """
+        Initializes the RateLimiter with the given rate.
+
+        Args:
+            requests_per_second (float): The maximum call rate; 0 or less disables limiting.
+        """
+        self.interval: float = 1 / requests_per_second if requests_per_second > 0 else 0
+        self.next_allowed_time: float = 0
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """
+        Blocks until the next call is allowed to start. The call's start time is reserved
+        while holding the lock, but the wait happens outside it, so waiting threads do not
+        hold up each other's reservations.
+        """
+        if not self.interval:
+            return
+        with self.lock:
+            now = time.monotonic()
+            start_time = max(now, self.next_allowed_time)
+            self.next_allowed_time = start_time + self.interval
+        if start_time > now:
+            time.sleep(start_time - now)
+
+class RateLimitedAdapter(HTTPAdapter):
+    """
+    An HTTPAdapter that waits for a RateLimiter before sending each request, so that every
+    request to the Jira API is paced, including retries and further result pages.
+    """
+
+    def __init__(self, rate_limiter: RateLimiter, **kwargs: Any) -> None:
+        """
+        Initializes the adapter with the rate limiter to wait for.
+
+        Args:
+            rate_limiter (RateLimiter): The rate limiter shared by the adapter's requests.
+            **kwargs (Any): Keyword arguments for HTTPAdapter, e.g. the pool sizes.
+        """
+        self.rate_limiter = rate_limiter
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):  # pylint: disable=arguments-differ
+        """
+        Waits for the rate limiter, then sends the request.
+        """
+        self.rate_limiter.acquire()
+        return super().send(request, **kwargs)
+
+def map_concurrently(func: Callable[[Any], Any],
+                     items: Iterable[Any],
+                     max_workers: int) -> List[Any]:
+    """
+    Calls `func` on each item from a pool of `max_workers` threads,
+    returning the results in the order of the items.
+
+    Args:
+        func (Callable[[Any], Any]): The function to call for each item.
+        items (Iterable[Any]): The items to process.
+        max_workers (int): The number of threads to call `func` from.
+
+    Returns:
+        List[Any]: The result for each item.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(func, items))
+
+def _prompt_int_field(field: str, message: str,
+                      allowed_values_by_field: Dict[str, List[Dict[str, Any]]]) -> int:
+    """
+    Prompts the user for a missing numeric field.
+
+    Args:
+        field (str): The ID of the missing field.
+        message (str): The error message Jira returned for the field.
+        allowed_values_by_field (Dict[str, List[Dict[str, Any]]]):
+            The allowed values of the project's custom fields.
+
+    Returns:
+        int: The entered number.
+    """
+    # pylint: disable=unused-argument
+    return int(input(f"Enter a number for {message.replace(' is required.', '')}: "))
+
+def _prompt_list_field(field: str, message: str,
+                       allowed_values_by_field: Dict[str, List[Dict[str, Any]]]) -> List[str]:
+    """
+    Prompts the user for a missing list field as comma-separated values.
+
+    Args:
+        field (str): The ID of the missing field.
+        message (str): The error message Jira returned for the field.
+        allowed_values_by_field (Dict[str, List[Dict[str, Any]]]):
+            The allowed values of the project's custom fields.
+
+    Returns:
+        List[str]: The entered values.
+    """
+    # pylint: disable=unused-argument
+    value = input(f"Enter values for {message.replace(' is required.', '')} (comma-separated): ")
+    return [item.strip() for item in value.split(',')]
+
+def _prompt_dict_field(field: str, message: str,
+                       allowed_values_by_field: Dict[str, List[Dict[str, Any]]]) -> Any:
+    """
+    Prompts the user for a missing complex field, listing the allowed options of custom
+    fields. Fields without known options are prompted for as text.
+
+    Args:
+        field (str): The ID of the missing field.
+        message (str): The error message Jira returned for the field.
+        allowed_values_by_field (Dict[str, List[Dict[str, Any]]]):
+            The allowed values of the project's custom fields.
+
+    Returns:
+        Any: The entered issue type name, option reference, or text.
+    """
+    if 'issuetype' in field:
+        # Special handling for issuetype fields if needed
+        return input("Enter an issue type: ").lower().capitalize()
+
+    allowed_values = allowed_values_by_field.get(field) if 'customfield_' in field else None
+    if not allowed_values:
+        return _prompt_str_field(field, message, allowed_values_by_field)
+
+    print("Enter an ID from the following:")
+    for option in allowed_values:
+        print(f"{option['id']} - {option['value']}")
+    return {"id": input("\n")}
+
+def _prompt_str_field(field: str, message: str,
+                      allowed_values_by_field: Dict[str, List[Dict[str, Any]]]) -> str:
+    """
+    Prompts the user for a missing text field, or a field of unknown type.
+
+    Args:
+        field (str): The ID of the missing field.
+        message (str): The error message Jira returned for the field.
+        allowed_values_by_field (Dict[str, List[Dict[str, Any]]]):
+            The allowed values of the project's custom fields.
+
+    Returns:
+        str: The entered text.
+    """
+    # pylint: disable=unused-argument
+    remove_chars = [' is required.', 'You must specify ', '.']
+    for char in remove_chars:
+        message = message.replace(char, '')
+    return input(f"Enter {message}: ")
+
+# Prompt for a missing field by its expected type in JIRA_FIELD_TYPES; other types use text
+FIELD_PROMPTS: Dict[Any, Callable[[str, str, Dict[str, List[Dict[str, Any]]]], Any]] = {
+    int: _prompt_int_field,
+    list: _prompt_list_field,
+    dict: _prompt_dict_field,
+    str: _prompt_str_field,
+}
@@ -1,32 +1,117 @@
 """
 This module provides functions to interact with the Trello API.
+
+py-trello and requests are imported when the client is first used, so commands answered
+from the cached list of boards do not load them.
 """
 
-import os
+from __future__ import annotations
+
 import argparse
-import traceback
-from typing import Any, Dict
-from trello import TrelloClient
-from trello import TokenError
-from trello.exceptions import ResourceUnavailable
+import functools
+import hashlib
+import json
+import logging
+import os
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+from .config import CACHE_DIR
+
+if TYPE_CHECKING:
+    import requests
+    from trello import TrelloClient
+
+logger = logging.getLogger(__name__)
+
+# Seconds for which the list of boards is reused, in memory and on disk
+BOARDS_CACHE_TTL = 600
+
+# Trello object IDs, which are accepted wherever a board name is
+TRELLO_ID_PATTERN = re.compile(r"[0-9a-f]{24}")
+
+# Response statuses for which Trello did not process a request, so any request is retried
+RETRY_STATUSES = (429, 503)
+
+# File caching the user's boards between invocations, cleared with --refresh-cache
+BOARDS_CACHE_FILE = os.path.join(CACHE_DIR, "boards.json")
+
+# Query for all of the user's boards, limited to the fields that are shown.
+# py-trello adds the credentials to the query it is given, so pass it a copy
+BOARD_QUERY_PARAMS = {"filter": "all", "fields": "name"}
+
+# Query for a board with its open lists and their open cards, limited to the fields shown;
+# like BOARD_QUERY_PARAMS, it is copied for each request
+BOARD_TREE_QUERY_PARAMS = {
+    "fields": "name",
+    "lists": "open",
+    "list_fields": "name",
+    "cards": "open",
+    "card_fields": "name,idList",
+}
+
+def _build_session(max_retries: int, concurrency: int) -> requests.Session:
+    """
+    Builds the session through which all Trello requests are sent.
+
+    Only failures that mean Trello did not process a request are retried: connection errors
+    and RETRY_STATUSES responses, with exponential backoff honouring Retry-After. Read
+    errors and timeouts are not, since replaying a POST that reached Trello would create
+    a duplicate board, list, or card. Once retries run out, the last response is raised.
+
+    Args:
+        max_retries (int): The maximum number of retries for each request.
+        concurrency (int): The number of concurrent requests to keep connections for.
+
+    Returns:
+        requests.Session: The configured session.
+    """
+    # pylint: disable=import-outside-toplevel
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    retry = Retry(total=max_retries,
+                  read=False,
+                  other=False,
+                  status_forcelist=RETRY_STATUSES,
+                  allowed_methods=None,
+                  backoff_factor=0.5,
+                  respect_retry_after_header=True,
+                  raise_on_status=False)
+    # Keep enough pooled connections for concurrent fetches
+    pool_size = max(concurrency, 10)
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=pool_size,
+                                          pool_maxsize=pool_size,
+                                          max_retries=retry))
+    return session
 
 # Decorator to handle common Trello-related exceptions
 def handle_trello_exceptions(func):
     """
     A decorator to handle common Trello-related exceptions.
     """
+    @functools.wraps(func)
     def wrapper(*args, **kwargs):
         try:
             return func(*args, **kwargs)
-        except TokenError as e:
-            print(f"Token error: {e}")
         except ValueError as e:
             print(f"Value error: {e}")
-        except ResourceUnavailable as e:
-            print(f"Resource unavailable: {e}")
         except Exception as e: # pylint: disable=broad-except
+            # py-trello's exceptions can only be raised once it has been imported
+            trello_exceptions = sys.modules.get("trello.exceptions")
+            if trello_exceptions and isinstance(e, trello_exceptions.TokenError):
+                print(f"Token error: {e}")
+                return None
+            if trello_exceptions and isinstance(e, trello_exceptions.ResourceUnavailable):
+                print(f"Resource unavailable: {e}")
+                return None
             print(f"Unexpected error in {func.__qualname__}: {e}")
-            traceback.print_exc()
+            logger.debug("Unexpected error in %s", func.__qualname__, exc_info=True)
+        return None
     return wrapper
 
 class TrelloCommands:
@@ -34,6 +119,9 @@ class TrelloCommands:
     The TrelloCommands class provides functions to interact with the Trello API.
     """
 
+    # Trello clients created so far, keyed by the settings they were created with
+    _clients: Dict[Tuple[Any, ...], TrelloClient] = {}
+
     def __init__(self, config_data: Dict[str, Any]) -> None:
         """
         Initializes the TrelloCommands class with the given configuration.
@@ -44,7 +132,47 @@ class TrelloCommands:
         """
 
         self.config: Dict[str, Any] = config_data
-        self.client: TrelloClient = self.initialize_trello_client()
+        self._client: Optional[TrelloClient] = None
+        self._boards_cache: Optional[Tuple[float,
+                                           List[Dict[str, Any]],
+                                           Dict[str, Dict[str, Any]],
+                                           Dict[str, Dict[str, Any]]]] = None
+
+        # Board and list ID of each configured alias, resolved once per instance
+        self._aliases: Dict[str, Tuple[Optional[str], Optional[str]]] = {
+            alias: (alias_info.get("board_id"), alias_info.get("list_id"))
+            for alias, alias_info in self.config["trello"].get("alias_ids", {}).items()
+            if alias_info
+        }
+
+        # Maps each Trello action's argparse dest to its handler, in order of precedence
+        self.dispatch: Dict[str, Callable[[argparse.Namespace], None]] = {
+            "boards": self._handle_boards,
+            "lists": self._handle_lists,
+            "cards": self._handle_cards,
+            "tree": self._handle_tree,
+            "add_board": self._handle_add_board,
+            "add_list": self._handle_add_list,
+            "add_card": self._handle_add_card,
+            "update_board": self._handle_update_board,
+            "update_list": self._handle_update_list,
+            "update_card": self._handle_update_card,
+            "delete_board": self._handle_delete_board,
+            "delete_list": self._handle_delete_list,
+            "delete_card": self._handle_delete_card,
+        }
+
+    @property
+    def client(self) -> TrelloClient:
+        """
+        The Trello client, created on first use.
+
+        Returns:
+            TrelloClient: The client for this instance's configuration.
+        """
+        if self._client is None:
+            self._client = self.initialize_trello_client()
+        return self._client
 
     def initialize_trello_client(self) -> TrelloClient:
         """
@@ -64,14 +192,165 @@ class TrelloCommands:
         if not api_key:
             raise ValueError("Missing Trello API key in the configuration file.")
 
-        # Set environment variables for the Trello client to use
-        os.environ["TRELLO_API_KEY"] = api_key
-        os.environ["TRELLO_API_SECRET"] = api_secret
+        # Instances with the same settings share one client, and with it one connection pool
+        max_retries = config_trello.get("max_retries", 3)
+        concurrency = config_trello.get("concurrency", 4)
+        client_key = (api_key, api_secret, oauth_token, max_retries, concurrency)
+        client = TrelloCommands._clients.get(client_key)
+        if client is not None:
+            return client
+
+        from trello import TrelloClient # pylint: disable=import-outside-toplevel
 
         # Initialize Trello client with available credentials
-        return TrelloClient(api_key=api_key,
-                            api_secret=api_secret,
-                            token=oauth_token)
+        client = TrelloClient(api_key=api_key,
+                              api_secret=api_secret,
+                              token=oauth_token,
+                              http_service=_build_session(max_retries, concurrency))
+        TrelloCommands._clients[client_key] = client
+        return client
+
+    def _get_boards(self) -> List[Dict[str, Any]]:
+        """
+        Returns all boards of the authenticated user, reusing a lookup younger than
+        BOARDS_CACHE_TTL seconds from this instance or from BOARDS_CACHE_FILE.
+        If Trello cannot be reached, an expired cached lookup is used instead.
+
+        Returns:
+            List[Dict[str, Any]]: The ID and name of each of the user's boards.
+        """
+        if self._boards_cache and self._boards_cache[0] > time.monotonic():
+            return self._boards_cache[1]
+
+        boards_json = self._read_boards_file(BOARDS_CACHE_TTL)
+        if boards_json is None:
+            import requests # pylint: disable=import-outside-toplevel
+            try:
+                # Request only the names, rather than every board field
+                boards_json = self.client.fetch_json("/members/me/boards",
+                                                     query_params=dict(BOARD_QUERY_PARAMS))
+            except (requests.ConnectionError, requests.Timeout):
+                boards_json = self._read_boards_file()
+                if boards_json is None:
+                    raise
+                print("Warning: Trello is unreachable, using the cached list of boards.")
+            else:
+                self._write_boards_file(boards_json)
+
+        return self._index_boards(boards_json)
+
+    def _index_boards(self, boards_json: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Caches boards in this instance for BOARDS_CACHE_TTL seconds, indexed by name and by ID.
+
+        Args:
+            boards_json (List[Dict[str, Any]]): The board JSON returned by Trello.
+
+        Returns:
+            List[Dict[str, Any]]: The ID and name of each of the user's boards.
+        """
+        # Index by name, keeping the first board when several share a name
+        boards_by_name: Dict[str, Dict[str, Any]] = {}
+        for board in boards_json:
+            boards_by_name.setdefault(board["name"], board)
+        boards_by_id = {board["id"]: board for board in boards_json}
+        self._boards_cache = (time.monotonic() + BOARDS_CACHE_TTL,
+                              boards_json, boards_by_name, boards_by_id)
+        return boards_json
+
+    def _get_cached_board(self, board_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Returns the board with the given ID if it is in a lookup younger than BOARDS_CACHE_TTL
+        seconds, from this instance or from BOARDS_CACHE_FILE, without contacting Trello.
+
+        Args:
+            board_id (str): The ID of the board.
+
+        Returns:
+            Optional[Dict[str, Any]]: The cached board, or None if it is not cached.
+        """
+        if not (self._boards_cache and self._boards_cache[0] > time.monotonic()):
+            boards_json = self._read_boards_file(BOARDS_CACHE_TTL)
+            if boards_json is None:
+                return None
+            self._index_boards(boards_json)
+        return self._boards_cache[3].get(board_id)
+
+    def _boards_cache_account(self) -> str:
+        """
+        Returns an identifier of the configured Trello credentials, so that boards cached
+        for one account are never used for another. The credentials themselves are not stored.
+
+        Returns:
+            str: A SHA-256 digest of the API key and token.
+        """
+        config_trello = self.config.get("trello", {})
+        credentials = f"{config_trello.get('api_key')}:{config_trello.get('oauth_token')}"
+        return hashlib.sha256(credentials.encode()).hexdigest()
+
+    def _read_boards_file(self, max_age: Optional[float] = None) -> Optional[List[Dict[str, Any]]]:
+        """
+        Reads the boards cached in BOARDS_CACHE_FILE for the configured account.
+
+        Args:
+            max_age (Optional[float]):
+                The maximum age of the file in seconds, or None to accept any age.
+
+        Returns:
+            Optional[List[Dict[str, Any]]]:
+                The cached board JSON, or None if the cache is missing, stale, or unreadable.
+        """
+        try:
+            if max_age is not None and os.stat(BOARDS_CACHE_FILE).st_mtime + max_age < time.time():
+                return None
+            with open(BOARDS_CACHE_FILE, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(cached, dict) or cached.get("account") != self._boards_cache_account():
+            return None
+        return cached.get("boards")
+
+    def _write_boards_file(self, boards_json: List[Dict[str, Any]]) -> None:
+        """
+        Writes the board JSON to BOARDS_CACHE_FILE, replacing the file atomically.
+        Failing to write the cache is not an error; the boards are simply fetched next time.
+
+        Args:
+            boards_json (List[Dict[str, Any]]): The board JSON returned by Trello.
+        """
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            temp_file = f"{BOARDS_CACHE_FILE}.tmp"
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump({"account": self._boards_cache_account(), "boards": boards_json}, f)
+            os.replace(temp_file, BOARDS_CACHE_FILE)
+        except OSError:
+            pass
+
+    def _clear_boards_cache(self) -> None:
+        """
+        Discards the cached boards, in memory and on disk, after boards have changed.
+        """
+        self._boards_cache = None
+        try:
+            os.remove(BOARDS_CACHE_FILE)
+        except OSError:
+            pass
+
+    def _get_board_by_name(self, board_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Returns the first of the user's boards with the given name.
+
+        Args:
+            board_name (str): The name of the board.
+
+        Returns:
+            Optional[Dict[str, Any]]: The matching board, or None if there is none.
+        """
+        self._get_boards()
+        return self._boards_cache[2].get(board_name)
 
     @handle_trello_exceptions
     def list_boards(self) -> None:
@@ -79,43 +358,114 @@ class TrelloCommands:
         Lists all Trello boards for the authenticated user.
         """
 
-        boards = self.client.list_boards()
-        for board in boards:
-            print(f"Board Name: {board.name} - Board ID: {board.id}")
+        boards = self._get_boards()
+        # Write all rows at once rather than printing each board separately
+        sys.stdout.write("".join(
+            f"Board Name: {board['name']} - Board ID: {board['id']}\n" for board in boards))
 
-    @handle_trello_exceptions
-    def list_lists(self, board_name_or_alias: str) -> None:
+    def _resolve_board_id(self, board_name_or_alias: str) -> Optional[str]:
         """
-        Lists all non-archived lists in a specified Trello board.
-        Can use board name or alias from the configuration.
+        Resolves a board alias from the configuration, a board ID, or a board name to a
+        board ID, printing an error if it cannot be resolved. Aliases and IDs are resolved
+        without fetching the list of boards.
 
         Args:
-            board_name_or_alias (str): The name of the Trello board or an alias.
+            board_name_or_alias (str): The name or ID of the Trello board, or an alias.
+
+        Returns:
+            Optional[str]: The board ID, or None if the board was not found.
         """
         # Check if alias exists in config
-        alias_info = self.config["trello"].get("alias_ids", {}).get(board_name_or_alias)
+        alias = self._aliases.get(board_name_or_alias)
 
-        if alias_info:
-            board_id = alias_info.get("board_id")
+        if alias:
+            board_id, _ = alias
             if not board_id:
                 print(f"Error: Alias '{board_name_or_alias}' does not contain a board ID.")
-                return
-            board = self.client.get_board(board_id)
-        else:
-            # Fallback to treating it as a board name
-            board = next(
-                (b for b in self.client.list_boards() if b.name == board_name_or_alias),
-                None
-            )
+            return board_id
 
+        if TRELLO_ID_PATTERN.fullmatch(board_name_or_alias):
+            return board_name_or_alias
+
+        # Fallback to treating it as a board name
+        board = self._get_board_by_name(board_name_or_alias)
         if not board:
             print(f"No board found with the name or alias '{board_name_or_alias}'.")
+            return None
+        return board["id"]
+
+    def _fetch_open_lists(self, board_id: str) -> List[Dict[str, Any]]:
+        """
+        Fetches the open lists of a board, with only their names and IDs.
+        An unknown board ID raises ResourceUnavailable.
+
+        Args:
+            board_id (str): The ID of the board.
+
+        Returns:
+            List[Dict[str, Any]]: The list JSON returned by Trello.
+        """
+        return self.client.fetch_json(f"/boards/{board_id}/lists",
+                                      query_params={"filter": "open", "fields": "name"})
+
+    @handle_trello_exceptions
+    def list_lists(self, board_name_or_alias: str) -> None:
+        """
+        Lists all non-archived lists in a specified Trello board.
+        Can use board name, board ID, or alias from the configuration.
+
+        Args:
+            board_name_or_alias (str): The name or ID of the Trello board, or an alias.
+        """
+        board_id = self._resolve_board_id(board_name_or_alias)
+        if not board_id:
+            return
+
+        # Write all rows at once rather than printing each list separately
+        sys.stdout.write("".join(
+            f"List Name: {list_json['name']} - List ID: {list_json['id']}\n"
+            for list_json in self._fetch_open_lists(board_id)))
+
+    @handle_trello_exceptions
+    def list_lists_of_boards(self, board_names_or_aliases: List[str]) -> None:
+        """
+        Lists all non-archived lists in several Trello boards, fetching the boards' lists
+        concurrently from a pool of `trello.concurrency` threads (default 4).
+
+        Args:
+            board_names_or_aliases (List[str]): The names of the Trello boards or aliases.
+        """
+        # Resolve names before starting threads, so the board list is fetched only once
+        boards = []
+        for name in board_names_or_aliases:
+            board_id = self._resolve_board_id(name)
+            if board_id:
+                boards.append((name, board_id))
+        if not boards:
             return
 
-        # Filter out archived lists (closed == True)
-        for list_obj in board.list_lists():
-            if not list_obj.closed:
-                print(f"List Name: {list_obj.name} - List ID: {list_obj.id}")
+        from trello.exceptions import ResourceUnavailable # pylint: disable=import-outside-toplevel
+
+        def _fetch(board: Tuple[str, str]) -> Tuple[List[Dict[str, Any]], str | None]:
+            """Fetches one board's lists, returning them or the error that prevented it."""
+            try:
+                return self._fetch_open_lists(board[1]), None
+            except ResourceUnavailable as e:
+                return [], str(e)
+
+        # Create the client before starting threads so that they all share it
+        _ = self.client
+        max_workers = self.config["trello"].get("concurrency", 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_fetch, boards))
+
+        for (name, _), (lists, error) in zip(boards, results):
+            if error:
+                print(f"Failed to list lists of board '{name}': {error}")
+                continue
+            sys.stdout.write(f"Lists of board '{name}':\n" + "".join(
+                f"List Name: {list_json['name']} - List ID: {list_json['id']}\n"
+                for list_json in lists))
 
     @handle_trello_exceptions
     def list_cards(self, list_name_or_alias: str) -> None:
@@ -127,24 +477,52 @@ class TrelloCommands:
             list_name_or_alias (str): The ID of the list or an alias from the configuration.
         """
         # Check if alias exists in config
-        alias_info = self.config["trello"].get("alias_ids", {}).get(list_name_or_alias)
+        alias = self._aliases.get(list_name_or_alias)
 
-        if alias_info:
-            list_id = alias_info.get("list_id")
+        if alias:
+            _, list_id = alias
             if not list_id:
                 print(f"Error: Alias '{list_name_or_alias}' does not contain a list ID.")
                 return
-            list_obj = self.client.get_list(list_id)
         else:
-            list_obj = self.client.get_list(list_name_or_alias)
+            list_id = list_name_or_alias
 
-        if not list_obj:
-            print(f"No list found with the ID or alias '{list_name_or_alias}'.")
+        # Fetch the open cards directly; an unknown list ID raises ResourceUnavailable
+        cards = self.client.fetch_json(f"/lists/{list_id}/cards",
+                                       query_params={"filter": "open", "fields": "name"})
+        # Write all rows at once rather than printing each card separately
+        sys.stdout.write("".join(
+            f"Card Name: {card_json['name']} - Card ID: {card_json['id']}\n"
+            for card_json in cards))
+
+    @handle_trello_exceptions
+    def list_tree(self, board_name_or_alias: str) -> None:
+        """
+        Lists all non-archived lists in a specified Trello board, each with its open cards,
+        fetching the board, its lists, and its cards in a single request.
+        Can use board name, board ID, or alias from the configuration.
+
+        Args:
+            board_name_or_alias (str): The name or ID of the Trello board, or an alias.
+        """
+        board_id = self._resolve_board_id(board_name_or_alias)
+        if not board_id:
             return
 
-        cards = list_obj.list_cards()
-        for card in cards:
-            print(f"Card Name: {card.name} - Card ID: {card.id}")
+        board = self.client.fetch_json(f"/boards/{board_id}",
+                                       query_params=dict(BOARD_TREE_QUERY_PARAMS))
+
+        # Group the cards by list, so each list's cards are printed beneath it
+        cards_by_list: Dict[str, List[Dict[str, Any]]] = {}
+        for card_json in board.get("cards", []):
+            cards_by_list.setdefault(card_json["idList"], []).append(card_json)
+
+        lines = [f"Board Name: {board['name']} - Board ID: {board['id']}\n"]
+        for list_json in board.get("lists", []):
+            lines.append(f"  List Name: {list_json['name']} - List ID: {list_json['id']}\n")
+            for card_json in cards_by_list.get(list_json["id"], []):
+                lines.append(f"    Card Name: {card_json['name']} - Card ID: {card_json['id']}\n")
+        sys.stdout.write("".join(lines))
 
     @handle_trello_exceptions
     def add_board(self, board_name: str) -> None:
@@ -155,6 +533,7 @@ class TrelloCommands:
             board_name (str): The name of the board to create.
         """
         new_board = self.client.add_board(board_name)
+        self._clear_boards_cache()
         print(f"Board '{new_board.name}' created successfully with ID: {new_board.id}")
 
     @handle_trello_exceptions
@@ -163,33 +542,28 @@ class TrelloCommands:
         Creates a new list in the specified board.
 
         Args:
-            board_name_or_alias (str): The name of the board or an alias from the configuration.
+            board_name_or_alias (str):
+                The name or ID of the board, or an alias from the configuration.
             list_name (str): The name of the list to create.
         """
 
-        # Check if alias exists in config
-        alias_info = self.config["trello"].get("alias_ids", {}).get(board_name_or_alias)
+        board_id = self._resolve_board_id(board_name_or_alias)
+        if not board_id:
+            return
 
-        if alias_info:
-            board_id = alias_info.get("board_id")
-            if not board_id:
-                print(f"Error: Alias '{board_name_or_alias}' does not contain a board ID.")
-                return
-            board = self.client.get_board(board_id)
+        # Only the board's name is needed, for the confirmation below; it is fetched unless
+        # the board is in the cached list of boards
+        board = self._get_cached_board(board_id)
+        if board:
+            board_name = board["name"]
         else:
-            # Fallback to treating it as a board name
-            board = next(
-                (b for b in self.client.list_boards() if b.name == board_name_or_alias),
-                None
-            )
+            board_name = self.client.fetch_json(f"/boards/{board_id}",
+                                                query_params={"fields": "name"})["name"]
 
-        if not board:
-            print(f"No board found with the name or alias '{board_name_or_alias}'.")
-            return
-
-        new_list = board.add_list(list_name)
-        print(f"List '{new_list.name}' created successfully \
-in board '{board.name}' with ID: {new_list.id}")
+        new_list = self.client.fetch_json("/lists", http_method="POST",
+                                          post_args={"name": list_name, "idBoard": board_id})
+        print(f"List '{new_list['name']}' created successfully \
+in board '{board_name}' with ID: {new_list['id']}")
 
     @handle_trello_exceptions
     def add_card(self, list_name_or_alias: str, card_name: str, description: str = "") -> None:
@@ -203,28 +577,31 @@ in board '{board.name}' with ID: {new_list.id}")
             description (str, optional): The description for the card.
         """
         # Check if alias exists in config
-        alias_info = self.config["trello"].get("alias_ids", {}).get(list_name_or_alias)
+        alias = self._aliases.get(list_name_or_alias)
 
-        if alias_info:
-            list_id = alias_info.get("list_id")
+        if alias:
+            _, list_id = alias
             if not list_id:
                 print(f"Error: Alias '{list_name_or_alias}' does not contain a list ID.")
                 return
-            list_obj = self.client.get_list(list_id)
         else:
-            # Fallback to treating it as a list name or ID
-            list_obj = self.client.get_list(list_name_or_alias)
+            # Fallback to treating it as a list ID
+            list_id = list_name_or_alias
 
-        if not list_obj:
-            print(f"No list found with the ID or alias '{list_name_or_alias}'.")
-            return
+        # Only the list's name is needed, for the confirmation below; an unknown list ID
+        # raises ResourceUnavailable
+        list_name = self.client.fetch_json(f"/lists/{list_id}",
+                                           query_params={"fields": "name"})["name"]
 
         while not card_name:
             card_name = input("Enter card name:\n")
 
         # Add the card to the specified list
-        list_obj.add_card(card_name, desc=description)
-        print(f"Card '{card_name}' added to list '{list_obj.name}'.")
+        self.client.fetch_json("/cards", http_method="POST",
+                               post_args={"name": card_name,
+                                          "idList": list_id,
+                                          "desc": description})
+        print(f"Card '{card_name}' added to list '{list_name}'.")
 
     @handle_trello_exceptions
     def update_board(self, board_id: str, new_name: str | None = None) -> None:
@@ -235,11 +612,14 @@ in board '{board.name}' with ID: {new_list.id}")
             board_id (str): The ID of the board to update.
             new_name (str): The new name for the board.
         """
-        board = self.client.get_board(board_id)
+        # Update the board directly; an unknown board ID raises ResourceUnavailable
         if new_name:
-            board.set_name(new_name)
+            self.client.fetch_json(f"/boards/{board_id}", http_method="PUT",
+                                   post_args={"name": new_name})
+            self._clear_boards_cache()
         print(f"Board '{board_id}' updated successfully.")
 
+    @handle_trello_exceptions
     def update_list(self, list_id: str, new_name: str | None = None) -> None:
         """
         Updates the specified list's name.
@@ -248,9 +628,9 @@ in board '{board.name}' with ID: {new_list.id}")
             list_id (str): The ID of the list to update.
             new_name (str): The new name for the list.
         """
-        list_obj = self.client.get_list(list_id)
         if new_name:
-            list_obj.set_name(new_name)
+            self.client.fetch_json(f"/lists/{list_id}", http_method="PUT",
+                                   post_args={"name": new_name})
         print(f"List '{list_id}' updated successfully.")
 
     @handle_trello_exceptions
@@ -266,12 +646,14 @@ in board '{board.name}' with ID: {new_list.id}")
             new_name (str): The new name for the card (optional).
             new_description (str): The new description for the card (optional).
         """
-        card = self.client.get_card(card_id)
-
+        # Both attributes are set with a single request
+        values = {}
         if new_name:
-            card.set_name(new_name)
+            values["name"] = new_name
         if new_description:
-            card.set_description(new_description)
+            values["desc"] = new_description
+        if values:
+            self.client.fetch_json(f"/cards/{card_id}", http_method="PUT", post_args=values)
         print(f"Card '{card_id}' updated successfully.")
 
     @handle_trello_exceptions
@@ -282,8 +664,9 @@ in board '{board.name}' with ID: {new_list.id}")
         Args:
             board_id (str): The ID of the board to delete.
         """
-        board = self.client.get_board(board_id)
-        board.close()
+        self.client.fetch_json(f"/boards/{board_id}/closed", http_method="PUT",
+                               post_args={"value": "true"})
+        self._clear_boards_cache()
         print(f"Board '{board_id}' closed successfully.")
 
     @handle_trello_exceptions
@@ -294,9 +677,9 @@ in board '{board.name}' with ID: {new_list.id}")
         Args:
             list_id (str): The ID of the list to delete.
         """
-        list_obj = self.client.get_list(list_id)
-        list_obj.close()
-        print(f"List '{list}' closed successfully.")
+        self.client.fetch_json(f"/lists/{list_id}/closed", http_method="PUT",
+                               post_args={"value": "true"})
+        print(f"List '{list_id}' closed successfully.")
 
     @handle_trello_exceptions
     def delete_card(self, card_id: str) -> None:
@@ -306,79 +689,167 @@ in board '{board.name}' with ID: {new_list.id}")
         Args:
             card_id (str): The ID of the card to delete.
         """
-
-        card = self.client.get_card(card_id)
-        card.delete()
+        self.client.fetch_json(f"/cards/{card_id}", http_method="DELETE")
         print(f"Card '{card_id}' deleted successfully.")
 
+    def _handle_boards(self, args: argparse.Namespace) -> None:
+        """
+        Handle `--boards`.
+
+        Args:
+            args (argparse.Namespace): The parsed command-line arguments.
+        """
+        # pylint: disable=unused-argument
+        self.list_boards()
+
+    def _handle_lists(self, args: argparse.Namespace) -> None:
+        """
+        Handle `--lists`, which takes one or more board names or aliases.
+
+        Args:
+            args (argparse.Namespace): The parsed command-line arguments.
+        """
+        if len(args.lists) == 1:
+            self.list_lists(args.lists[0])
+        else:
+            self.list_lists_of_boards(args.lists)
+
+    def _handle_cards(self, args: argparse.Namespace) -> None:
+        """
+        Handle `--cards`.
+
+        Args:
+            args (argparse.Namespace): The parsed command-line arguments.
+        """
+        self.list_cards(args.cards)
+
+    def _handle_tree(self, args: argparse.Namespace) -> None:
+        """
+        Handle `--tree`.
+
+        Args:
+            args (argparse.Namespace): The parsed command-line arguments.
+        """
+        self.list_tree(args.tree)
+
+    def _handle_add_board(self, args: argparse.Namespace) -> None:
+        """
+        Handle `--add-board`.
+
+        Args:
+            args (argparse.Namespace): The parsed command-line arguments.
+        """
+        self.add_board(args.add_board)
+
+    def _handle_add_list(self, args: argparse.Namespace) -> None:
+        """
+        Handle `--add-list`, which takes a board name or alias and a list name.
+
+        Args:
+            args (argparse.Namespace): The parsed command-line arguments.
+        """
+        if len(args.add_list) >= 2:
+            self.add_list(args.add_list[0], args.add_list[1])
+        else:
+            print("Error: Missing arguments for adding list. Requires board and list names.")
+
+    def _handle_add_card(self, args: argparse.Namespace) -> None:
+        """
+        Handle `--add-card`, which takes a list ID or alias, a card name, and optionally
+        a description.
+
+        Args:
+            args (argparse.Namespace): The parsed command-line arguments.
+        """
+        if len(args.add_card) >= 2:
+            list_name_or_alias = args.add_card[0]
+            card_name = args.add_card[1]
+            # Use an empty string if description is not provided
+            description = args.add_card[2] if len(args.add_card) > 2 else ""
+            self.add_card(list_name_or_alias, card_name, description)
+        else:
+            print("Error: Missing arguments for adding card. Requires list and card name.")
+
+    def _handle_update_board(self, args: argparse.Namespace) -> None:
+        """
+        Handle `--update-board`, which takes a board ID and a new name.
+
+        Args:
+            args (argparse.Namespace): The parsed command-line arguments.
+        """
+        if len(args.update_board) >= 2:
+            self.update_board(args.update_board[0], args.update_board[1])
+        else:
+            print("Error: Missing arguments for updating board. ",
+                  "Requires board ID and new name.")
+
+    def _handle_update_list(self, args: argparse.Namespace) -> None:
+        """
+        Handle `--update-list`, which takes a list ID and a new name.
+
+        Args:
+            args (argparse.Namespace): The parsed command-line arguments.
+        """
+        if len(args.update_list) >= 2:
+            self.update_list(args.update_list[0], args.update_list[1])
+        else:
+            print("Error: Missing arguments for updating list. Requires list ID and new name.")
+
+    def _handle_update_card(self, args: argparse.Namespace) -> None:
+        """
+        Handle `--update-card`, which takes a card ID, a new name, and optionally a description.
+
+        Args:
+            args (argparse.Namespace): The parsed command-line arguments.
+        """
+        if not 2 <= len(args.update_card) <= 3:
+            raise TypeError("--update-card requires a card ID, a new name, "
+                            "and optionally a description.\n")
+        self.update_card(*args.update_card)
+
+    def _handle_delete_board(self, args: argparse.Namespace) -> None:
+        """
+        Handle `--delete-board`.
+
+        Args:
+            args (argparse.Namespace): The parsed command-line arguments.
+        """
+        self.delete_board(args.delete_board)
+
+    def _handle_delete_list(self, args: argparse.Namespace) -> None:
+        """
+        Handle `--delete-list`.
+
+        Args:
+            args (argparse.Namespace): The parsed command-line arguments.
+        """
+        self.delete_list(args.delete_list)
+
+    def _handle_delete_card(self, args: argparse.Namespace) -> None:
+        """
+        Handle `--delete-card`.
+
+        Args:
+            args (argparse.Namespace): The parsed command-line arguments.
+        """
+        self.delete_card(args.delete_card)
+
     def handle_trello_commands(self, args: argparse.Namespace) -> None:
         """
         Handle Trello commands based on the provided arguments.
 
+        The cache is cleared first if requested; then the first action set,
+        in `self.dispatch` order, is dispatched to its handler.
+
         Args:
             args (argparse.Namespace): The parsed command-line arguments.
         """
 
-        if args.boards:
-            self.list_boards()
-        elif args.lists:
-            if args.lists:
-                self.list_lists(args.lists)
-            else:
-                print("Error: Missing argument for listing lists.")
-        elif args.cards:
-            if args.cards:
-                self.list_cards(args.cards)
-            else:
-                print("Error: Missing argument for listing cards.")
-        elif args.add_board:
-            if args.add_board:
-                self.add_board(args.add_board)
-            else:
-                print("Error: Missing argument for adding board.")
-        elif args.add_list:
-            if len(args.add_list) >= 2:
-                self.add_list(args.add_list[0], args.add_list[1])
-            else:
-                print("Error: Missing arguments for adding list. Requires board and list names.")
-        elif args.add_card:
-            if len(args.add_card) >= 2:
-                list_name_or_alias = args.add_card[0]
-                card_name = args.add_card[1]
-                # Use an empty string if description is not provided
-                description = args.add_card[2] if len(args.add_card) > 2 else ""
-                self.add_card(list_name_or_alias, card_name, description)
-            else:
-                print("Error: Missing arguments for adding card. Requires list and card name.")
-        elif args.update_board:
-            if len(args.update_board) >= 2:
-                self.update_board(args.update_board[0], args.update_board[1])
-            else:
-                print("Error: Missing arguments for updating board. ",
-                      "Requires board ID and new name.")
-        elif args.update_list:
-            if len(args.update_list) >= 2:
-                self.update_list(args.update_list[0], args.update_list[1])
-            else:
-                print("Error: Missing arguments for updating list. Requires list ID and new name.")
-        elif args.update_card:
-            if len(args.update_card) >= 3:
-                self.update_card(args.update_card[0], args.update_card[1], args.update_card[2])
-            else:
-                print("Error: Missing arguments for updating card. ",
-                      "Requires card ID, new name, and description.")
-        elif args.delete_board:
-            if args.delete_board:
-                self.delete_board(args.delete_board)
-            else:
-                print("Error: Missing argument for deleting board.")
-        elif args.delete_list:
-            if args.delete_list:
-                self.delete_list(args.delete_list)
-            else:
-                print("Error: Missing argument for deleting list.")
-        elif args.delete_card:
-            if args.delete_card:
-                self.delete_card(args.delete_card)
-            else:
-                print("Error: Missing argument for deleting card.")
+        if args.refresh_cache:
+            self._clear_boards_cache()
+            print("Cleared the cached list of boards.")
+
+        for dest, handler in self.dispatch.items():
+            if getattr(args, dest, None):
+                handler(args)
+                return
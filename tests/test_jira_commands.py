@@ -0,0 +1,93 @@
+"""
+Tests for the concurrent Jira batch commands and their request pacing.
+"""
+
+import copy
+import io
+import threading
+import unittest
+from contextlib import redirect_stdout
+from types import SimpleNamespace
+from typing import Any, Dict
+from unittest import mock
+
+from requests.adapters import HTTPAdapter
+
+from atlasman.config import DEFAULT_CONFIG
+from atlasman.jira_commands import JiraCommands
+from atlasman.jira_helpers import RateLimitedAdapter, RateLimiter
+
+# Seconds a fake request waits for the others in its batch before giving up
+BARRIER_TIMEOUT = 10
+
+
+class FakeJira:  # pylint: disable=too-few-public-methods
+    """
+    A stand-in for the JIRA client whose requests first wait for the rate limiter, as
+    requests sent through the Jira client's session do, and then for a barrier that only
+    opens once `parties` requests are in flight at the same time.
+    """
+
+    def __init__(self, rate_limiter: RateLimiter, parties: int) -> None:
+        self.rate_limiter = rate_limiter
+        self.barrier = threading.Barrier(parties, timeout=BARRIER_TIMEOUT)
+
+    def create_issue(self, fields: Dict[str, Any]) -> SimpleNamespace:
+        """
+        Pretends to create an issue once all of the batch's requests are in flight.
+        """
+        self.rate_limiter.acquire()
+        self.barrier.wait()
+        return SimpleNamespace(key=f"{fields['project']['key']}-{fields['summary']}")
+
+
+class TestAddIssues(unittest.TestCase):
+    """
+    Tests for JiraCommands.add_issues.
+    """
+
+    def test_batch_runs_concurrently_with_default_limits(self) -> None:
+        """
+        With the default concurrency and rate limit, all of the issues are created in parallel.
+        """
+        config = {"jira": copy.deepcopy(DEFAULT_CONFIG["jira"])}
+        concurrency = config["jira"]["concurrency"]
+        commands = JiraCommands(config)
+        fake_client = FakeJira(commands.rate_limiter, concurrency)
+        commands._client = fake_client  # pylint: disable=protected-access
+
+        titles = [str(number) for number in range(concurrency)]
+        with redirect_stdout(io.StringIO()) as output:
+            commands.add_issues("TEST", titles)
+
+        self.assertFalse(fake_client.barrier.broken)
+        for title in titles:
+            self.assertIn(f"'TEST-{title}' created successfully", output.getvalue())
+
+
+class TestRateLimitedAdapter(unittest.TestCase):
+    """
+    Tests for RateLimitedAdapter.
+    """
+
+    def test_send_waits_for_the_rate_limiter(self) -> None:
+        """
+        Each request waits for the rate limiter before it is sent.
+        """
+        rate_limiter = mock.Mock(spec=RateLimiter)
+        adapter = RateLimitedAdapter(rate_limiter)
+        calls = mock.Mock()
+        calls.attach_mock(rate_limiter.acquire, "acquire")
+        request = object()
+
+        with mock.patch.object(HTTPAdapter, "send", return_value="response") as send:
+            calls.attach_mock(send, "send")
+            response = adapter.send(request, timeout=5)
+
+        self.assertEqual(response, "response")
+        self.assertEqual(calls.mock_calls,
+                         [mock.call.acquire(), mock.call.send(request, timeout=5)])
+
+
+if __name__ == "__main__":
+    unittest.main()